@@ -31,6 +31,10 @@ class AudioRecorder:
         self.channels = 1  # Mono
         self.rate = 16000   # 16kHz sample rate (optimal for Whisper)
         
+        # Ring buffer of the most recent samples, used for the level meter
+        self._level_ring = None
+        self._ring_pos = 0
+        
         # For mixed recording
         self.mic_stream = None
         self.system_stream = None
@@ -139,6 +143,9 @@ class AudioRecorder:
             
             # Initialize recording
             self.frames = []
+            if self._level_ring is not None:
+                self._level_ring[:] = 0
+            self._ring_pos = 0
             self.is_recording = True
             
             # Start recording thread
@@ -195,13 +202,37 @@ class AudioRecorder:
         if not self.is_recording:
             return None
         
+        self.stop_capture()
+        return self.save_recording()
+    
+    def stop_capture(self):
+        """
+        Stop capturing audio without writing it to disk
+        
+        Returns:
+            np.ndarray: The recording as a 16 kHz mono float32 waveform, or None
+        """
+        if not self.is_recording:
+            return None
+        
         self.is_recording = False
         
         # Wait for recording thread to finish
         if self.recording_thread:
             self.recording_thread.join(timeout=2.0)
         
-        # Save the recording
+        return self.get_waveform()
+    
+    def get_waveform(self):
+        """Return the captured frames as a float32 waveform in [-1, 1], or None if empty"""
+        if not self.frames:
+            return None
+        import numpy as np
+        samples = np.frombuffer(b''.join(self.frames), dtype=np.int16)
+        return samples.astype(np.float32) / 32768.0
+    
+    def save_recording(self):
+        """Write the captured frames to the recording file and return its path"""
         if self.frames and self.recording_file:
             try:
                 print(f"Saving recording to: {self.recording_file}")
@@ -357,11 +388,7 @@ class AudioRecorder:
                     
                     # Calculate audio level from mixed data
                     if self.audio_level_callback:
-                        import numpy as np
-                        audio_data = np.frombuffer(mixed_data, dtype=np.int16)
-                        rms = np.sqrt(np.mean(audio_data**2))
-                        level = min(100, (rms / 32767.0) * 100)
-                        self.audio_level_callback(level)
+                        self._update_level(mixed_data)
                         
                 except Exception as e:
                     print(f"Error reading mixed audio data: {e}")
@@ -423,12 +450,7 @@ class AudioRecorder:
                     
                     # Calculate audio level
                     if self.audio_level_callback:
-                        import numpy as np
-                        audio_data = np.frombuffer(data, dtype=np.int16)
-                        rms = np.sqrt(np.mean(audio_data**2))
-                        # Convert to percentage (0-100)
-                        level = min(100, (rms / 32767.0) * 100)
-                        self.audio_level_callback(level)
+                        self._update_level(data)
                         
                 except Exception as e:
                     print(f"Error reading audio data: {e}")
@@ -463,6 +485,26 @@ class AudioRecorder:
                 print(f"Error in single source recording: {e}")
                 self.is_recording = False
     
+    def _update_level(self, data):
+        """Report the RMS level (0-100) of the last 4096 samples to the level callback"""
+        import numpy as np
+        if self._level_ring is None:
+            self._level_ring = np.zeros(4096, dtype=np.int16)
+        
+        chunk = np.frombuffer(data, dtype=np.int16)[-len(self._level_ring):]
+        end = self._ring_pos + len(chunk)
+        if end <= len(self._level_ring):
+            self._level_ring[self._ring_pos:end] = chunk
+        else:
+            split = len(self._level_ring) - self._ring_pos
+            self._level_ring[self._ring_pos:] = chunk[:split]
+            self._level_ring[:end - len(self._level_ring)] = chunk[split:]
+        self._ring_pos = end % len(self._level_ring)
+        
+        # Square in int32 so loud samples cannot overflow int16
+        rms = np.sqrt(np.mean(self._level_ring.astype(np.int32) ** 2))
+        self.audio_level_callback(min(100, (rms / 32768.0) * 100))
+    
     def _mix_audio_data(self, mic_data, system_data):
         """Mix microphone and system audio data"""
         try:
@@ -66,59 +66,40 @@ def save_transcription(result, audio_file_path, output_format="txt"):
     
     base_name = Path(audio_file_path).stem
     
+    has_speakers = any('speaker' in segment for segment in result.get('segments', []))
+    
     if output_format == "txt":
         output_file = f"{base_name}_transcription.txt"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            # Check if speaker information is available
-            has_speakers = any('speaker' in segment for segment in result.get('segments', []))
-            
-            if has_speakers:
-                # Format with speaker labels
-                for segment in result["segments"]:
-                    speaker = segment.get('speaker', 'Speaker 1')
-                    start_time = format_time(segment["start"])
-                    end_time = format_time(segment["end"])
-                    text = segment['text'].strip()
-                    f.write(f"[{start_time} - {end_time}] {speaker}: {text}\n")
-            else:
-                # Standard format without speakers
-                f.write(result["text"])
+        if has_speakers:
+            # Format with speaker labels
+            parts = [f"[{format_time(segment['start'])} - {format_time(segment['end'])}] "
+                     f"{segment.get('speaker', 'Speaker 1')}: {segment['text'].strip()}\n"
+                     for segment in result["segments"]]
+        else:
+            # Standard format without speakers
+            parts = [result["text"]]
     
     elif output_format == "srt":
         output_file = f"{base_name}_transcription.srt"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            has_speakers = any('speaker' in segment for segment in result.get('segments', []))
-            
-            for i, segment in enumerate(result["segments"], 1):
-                start_time = format_time(segment["start"])
-                end_time = format_time(segment["end"])
-                text = segment['text'].strip()
-                
-                if has_speakers:
-                    speaker = segment.get('speaker', 'Speaker 1')
-                    text = f"{speaker}: {text}"
-                
-                f.write(f"{i}\n")
-                f.write(f"{start_time} --> {end_time}\n")
-                f.write(f"{text}\n\n")
+        parts = []
+        for i, segment in enumerate(result["segments"], 1):
+            text = segment['text'].strip()
+            if has_speakers:
+                text = f"{segment.get('speaker', 'Speaker 1')}: {text}"
+            parts.append(f"{i}\n{format_time(segment['start'])} --> {format_time(segment['end'])}\n{text}\n\n")
     
     elif output_format == "vtt":
         output_file = f"{base_name}_transcription.vtt"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("WEBVTT\n\n")
-            has_speakers = any('speaker' in segment for segment in result.get('segments', []))
-            
-            for segment in result["segments"]:
-                start_time = format_time_vtt(segment["start"])
-                end_time = format_time_vtt(segment["end"])
-                text = segment['text'].strip()
-                
-                if has_speakers:
-                    speaker = segment.get('speaker', 'Speaker 1')
-                    text = f"{speaker}: {text}"
-                
-                f.write(f"{start_time} --> {end_time}\n")
-                f.write(f"{text}\n\n")
+        parts = ["WEBVTT\n\n"]
+        for segment in result["segments"]:
+            text = segment['text'].strip()
+            if has_speakers:
+                text = f"{segment.get('speaker', 'Speaker 1')}: {text}"
+            parts.append(f"{format_time_vtt(segment['start'])} --> {format_time_vtt(segment['end'])}\n{text}\n\n")
+    
+    # Build the whole file in memory and write it once
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write("".join(parts))
     
     return output_file
 
@@ -7,9 +7,14 @@ A modern GUI for audio transcription using OpenAI Whisper with speaker diarizati
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import threading
+import queue
+import gc
+import importlib.util
 import os
 import platform
+import shutil
 import subprocess
+from collections import namedtuple
 from pathlib import Path
 
 # Try to import audio recording functionality
@@ -19,13 +24,90 @@ try:
 except ImportError:
     AUDIO_RECORDING_AVAILABLE = False
 
+# Try to import keyring (stores the Hugging Face token in the OS credential store)
+try:
+    import keyring
+    from keyring.errors import KeyringError
+    KEYRING_AVAILABLE = True
+except ImportError:
+    KEYRING_AVAILABLE = False
+
+KEYRING_SERVICE = "AudioTranscriber"
+
+# Try to import openai-whisper (reference PyTorch backend and ffmpeg decoding)
+try:
+    import whisper as _whisper
+except ImportError:
+    _whisper = None
+
+# Try to import faster-whisper (CTranslate2 backend with INT8 weights)
+try:
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
+
+def _module_available(name):
+    """True if the (possibly dotted) module can be imported, without importing it"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ImportError:
+        return False
+
+
+# Hugging Face transformers (chunked, batched Whisper pipeline), ONNX Runtime
+# (INT8-quantized CPU inference) and OpenVINO (Intel CPUs/iGPUs) are heavy imports,
+# so at startup only check that they are installed; _get_asr_pipeline imports them
+TRANSFORMERS_AVAILABLE = _module_available("transformers")
+ONNX_WHISPER_AVAILABLE = _module_available("optimum.onnxruntime")
+OPENVINO_AVAILABLE = _module_available("optimum.intel.openvino")
+
+ONNX_MODEL_DIR = Path("models") / "whisper-base"
+ONNX_INT8_MODEL_DIR = Path("models") / "whisper-base-int8"
+
+OPENVINO_MODEL_DIR = Path("models") / "whisper-base-ov-int8"
+
 # Try to import speaker diarization
 try:
-    from speaker_diarization import transcribe_with_speaker_diarization
+    from speaker_diarization import SpeakerDiarizer
     SPEAKER_DIARIZATION_AVAILABLE = True
 except ImportError:
     SPEAKER_DIARIZATION_AVAILABLE = False
 
+# Longest decode buffer kept in page-locked memory on CUDA (10 minutes at 16 kHz)
+PINNED_AUDIO_MAX_SAMPLES = 10 * 60 * 16000
+
+# Transcript segment as consumed by the display, save and summary code
+Segment = namedtuple('Segment', 'start end speaker text')
+
+
+def _detect_device():
+    """Return the fastest available torch device name ("cuda", "mps" or "cpu")"""
+    try:
+        import torch
+    except ImportError:
+        return "cpu"
+    if torch.cuda.is_available():
+        return "cuda"
+    mps = getattr(torch.backends, "mps", None)
+    if mps is not None and mps.is_available():
+        return "mps"
+    return "cpu"
+
+
+def _export_model_dir(target, export):
+    """Run export(tmp_dir) and move the finished directory to target in one step
+    
+    An interrupted export leaves only the temporary directory behind, which the
+    next attempt removes, so target existing always means the export completed.
+    """
+    tmp = target.with_name(target.name + ".partial")
+    shutil.rmtree(tmp, ignore_errors=True)
+    export(tmp)
+    os.replace(tmp, target)
+    return target
+
 
 class AudioTranscriberGUI:
     def __init__(self, root):
@@ -37,12 +119,34 @@ class AudioTranscriberGUI:
         # Variables
         self.audio_file_path = tk.StringVar()
         self.recording_format = tk.StringVar(value="wav")
-        self.hf_token = tk.StringVar()
+        self.hf_token = tk.StringVar(value=self._load_stored_token())
+        
+        # Plain mirrors of the StringVars above, read by the transcription code
+        self._audio_file = ""
+        self._hf_token_value = self.hf_token.get() or None
         self.detect_speakers = tk.BooleanVar()
+        # "auto", "faster-whisper" or "pipeline" (transformers, with ONNX/OpenVINO on CPU)
+        self.asr_backend = tk.StringVar(value="auto")
         self.is_recording = False
         self.is_paused = False
         self.is_transcribing = False
         
+        # Models are loaded on first use and kept until "Unload models"
+        self._device = _detect_device()
+        # openai-whisper keeps a sparse alignment-heads buffer that MPS cannot hold
+        self._whisper_device = "cpu" if self._device == "mps" else self._device
+        self._fw_model = None
+        self._whisper_model = None
+        self._asr_pipe = None
+        self._vad = None
+        self._diarizer = None
+        self._diarizer_token = None
+        self._streamed = False  # segments were already appended while decoding
+        self._audio_buf = None
+        
+        self._transcriptions_dir = Path("Transcriptions")
+        self._transcriptions_dir.mkdir(exist_ok=True)
+        
         # Model options
         self.model_options = [
             ("Tiny (Fastest, ~1GB VRAM)", "tiny"),
@@ -80,6 +184,12 @@ class AudioTranscriberGUI:
         
         self.setup_ui()
         
+        # One long-lived worker runs transcription jobs so loaded models stay hot
+        self._jobs = queue.Queue()
+        worker = threading.Thread(target=self._worker_loop)
+        worker.daemon = True
+        worker.start()
+        
     def setup_ui(self):
         # Configure modern styling with colors
         style = ttk.Style()
@@ -201,6 +311,16 @@ class AudioTranscriberGUI:
         settings_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Settings", menu=settings_menu)
         settings_menu.add_command(label="Hugging Face Authentication", command=self.open_hf_settings)
+        backend_menu = tk.Menu(settings_menu, tearoff=0)
+        settings_menu.add_cascade(label="Whisper backend", menu=backend_menu)
+        backend_menu.add_radiobutton(label="Automatic", variable=self.asr_backend, value="auto")
+        backend_menu.add_radiobutton(label="faster-whisper", variable=self.asr_backend, value="faster-whisper",
+                                     state="normal" if FASTER_WHISPER_AVAILABLE else "disabled")
+        backend_menu.add_radiobutton(label="Transformers pipeline (ONNX/OpenVINO on CPU)",
+                                     variable=self.asr_backend, value="pipeline",
+                                     state="normal" if TRANSFORMERS_AVAILABLE else "disabled")
+        settings_menu.add_separator()
+        settings_menu.add_command(label="Unload models", command=self.unload_models)
         
         # Main container with compact padding
         main_container = tk.Frame(self.root, bg=colors['background'])
@@ -541,6 +661,8 @@ class AudioTranscriberGUI:
                                     font=('Segoe UI', 9), 
                                     fg=colors['text_light'], bg=colors['surface'])
         self.status_label.pack(anchor=tk.W, pady=(0, 10))
+        self._status_colors = (colors['text_light'], colors['success'])
+        self._status_flash_id = None
         
         # Create tabbed interface for results
         self.results_notebook = ttk.Notebook(content_frame)
@@ -594,6 +716,15 @@ class AudioTranscriberGUI:
         """Update status label"""
         self.status_label.config(text=message)
     
+    def flash_status(self, message):
+        """Show a success message in the status bar, highlighted for a few seconds"""
+        normal_fg, success_fg = self._status_colors
+        if self._status_flash_id is not None:
+            self.status_label.after_cancel(self._status_flash_id)
+        self.status_label.config(text=message, fg=success_fg)
+        self._status_flash_id = self.status_label.after(
+            3000, lambda: self.status_label.config(fg=normal_fg))
+    
     def update_progress(self, value):
         """Update progress bar"""
         self.progress_var.set(value)
@@ -729,7 +860,7 @@ class AudioTranscriberGUI:
                 self.audio_level_label.config(text="0%")
             
             # Update the file path to the saved recording
-            self.audio_file_path.set(saved_file)
+            self._set_audio_file(saved_file)
             
             messagebox.showinfo("Recording Complete", 
                               f"Recording saved successfully!\n\nFile: {saved_file}")
@@ -774,7 +905,7 @@ class AudioTranscriberGUI:
                     self.audio_level_label.config(text="0%")
                 
                 # Update the file path to the saved recording
-                self.audio_file_path.set(saved_file)
+                self._set_audio_file(saved_file)
                 
                 messagebox.showinfo("Recording Complete", 
                                   f"Recording saved successfully!\n\nFile: {saved_file}")
@@ -829,15 +960,20 @@ class AudioTranscriberGUI:
         )
         
         if filename:
-            self.audio_file_path.set(filename)
+            self._set_audio_file(filename)
+    
+    def _set_audio_file(self, path):
+        """Select the audio file to transcribe"""
+        self._audio_file = path
+        self.audio_file_path.set(path)
     
     def clear_audio_file(self):
         """Clear the selected audio file"""
-        self.audio_file_path.set("")
+        self._set_audio_file("")
     
     def view_transcriptions(self):
         """Open the Transcriptions folder"""
-        transcriptions_dir = Path("Transcriptions")
+        transcriptions_dir = self._transcriptions_dir
         if transcriptions_dir.exists():
             if platform.system() == "Windows":
                 os.startfile(str(transcriptions_dir))
@@ -905,20 +1041,47 @@ class AudioTranscriberGUI:
         # Focus on token entry
         token_entry.focus()
     
+    def _load_stored_token(self):
+        """Return the Hugging Face token saved in the OS credential store, if any"""
+        if not KEYRING_AVAILABLE:
+            return ""
+        try:
+            return keyring.get_password(KEYRING_SERVICE, "hf_token") or ""
+        except KeyringError as e:
+            print(f"Could not read token from keyring: {e}")
+            return ""
+    
     def save_hf_token(self, window):
         """Save Hugging Face token"""
         token = self.hf_token.get().strip()
         if token:
-            messagebox.showinfo("Success", "Hugging Face token saved successfully!")
+            self._hf_token_value = token
+            if KEYRING_AVAILABLE:
+                try:
+                    keyring.set_password(KEYRING_SERVICE, "hf_token", token)
+                except KeyringError as e:
+                    print(f"Could not store token in keyring: {e}")
             window.destroy()
+            self.flash_status("Hugging Face token saved")
         else:
             messagebox.showwarning("Warning", "Please enter a valid token.")
     
     def clear_hf_token(self, window):
         """Clear Hugging Face token"""
         self.hf_token.set("")
-        messagebox.showinfo("Cleared", "Hugging Face token cleared.")
+        self._hf_token_value = None
+        if KEYRING_AVAILABLE:
+            try:
+                keyring.delete_password(KEYRING_SERVICE, "hf_token")
+            except KeyringError:
+                pass  # Nothing stored
+        # The cached diarizer still holds the old token (a running job keeps its own reference)
+        if self._diarizer is not None and not self.is_transcribing:
+            self._diarizer.close()
+        self._diarizer = None
+        self._diarizer_token = None
         window.destroy()
+        self.flash_status("Hugging Face token cleared")
     
     def start_transcription(self):
         """Start transcription process"""
@@ -927,7 +1090,7 @@ class AudioTranscriberGUI:
             return
         
         # Check if audio file is selected
-        audio_file = self.audio_file_path.get()
+        audio_file = self._audio_file
         if not audio_file:
             messagebox.showerror("Error", "Please select an audio file or record audio first!")
             return
@@ -937,20 +1100,35 @@ class AudioTranscriberGUI:
             messagebox.showerror("Error", f"Audio file not found: {audio_file}")
             return
         
-        # Start transcription in a separate thread
+        # Hand the job to the background worker
         self.is_transcribing = True
         self.transcribe_button.config(text="Transcribing...", state="disabled")
         self.update_progress(0)
-        
-        transcription_thread = threading.Thread(target=self._transcribe_audio_thread)
-        transcription_thread.daemon = True
-        transcription_thread.start()
+        self.full_transcription_text.delete(1.0, tk.END)
+        self._streamed = False
+        
+        self._jobs.put({
+            "file": audio_file,
+            "diarize": self.detect_speakers.get(),
+            "backend": self.asr_backend.get(),
+            "hf_token": self._hf_token_value
+        })
     
-    def _transcribe_audio_thread(self):
-        """Transcribe audio in a separate thread"""
+    def _worker_loop(self):
+        """Run queued transcription jobs one at a time"""
+        while True:
+            job = self._jobs.get()
+            self._run_job(job)
+    
+    def _run_job(self, job):
+        """Transcribe one audio file (runs on the worker thread)"""
         try:
-            audio_file = self.audio_file_path.get()
-            detect_speakers = self.detect_speakers.get()
+            audio_file = job["file"]
+            detect_speakers = job["diarize"]
+            
+            # Decode once; every model below works from the same 16 kHz waveform
+            self.update_status("Decoding audio...")
+            audio = self._load_audio(audio_file)
             
             self.update_status("Loading Whisper model...")
             self.update_progress(10)
@@ -958,30 +1136,99 @@ class AudioTranscriberGUI:
             if detect_speakers and SPEAKER_DIARIZATION_AVAILABLE:
                 # Use speaker diarization
                 self.update_status("Loading speaker diarization model...")
-                hf_token = self.hf_token.get().strip() if self.hf_token.get().strip() else None
+                hf_token = job["hf_token"]
                 
-                result = transcribe_with_speaker_diarization(
-                    audio_file, 
-                    "base", 
-                    None, 
-                    "transcribe", 
-                    hf_token
-                )
+                if self._diarizer is None or self._diarizer_token != hf_token:
+                    self._diarizer = SpeakerDiarizer("base", hf_token, device=self._device,
+                                                    persist_token=False)
+                    self._diarizer_token = hf_token
+                
+                diarizer = self._diarizer
+                if not diarizer.whisper_model:
+                    diarizer.load_models()
+                
+                self.update_status("Transcribing and detecting speakers...")
+                self.update_progress(30)
+                
+                # Runs pyannote and Whisper concurrently when the pipeline is available
+                result = diarizer.perform_diarization(audio_file, audio=audio)
+            elif self._use_asr_pipeline(job["backend"]):
+                # Standard transcription with 30 s windows batched through the encoder
+                if self._asr_pipe is None:
+                    self.update_status("Preparing Whisper pipeline (first run only)...")
+                    self._asr_pipe = self._get_asr_pipeline()
+                
+                self.update_status("Detecting speech...")
+                voiced, spans = self._apply_vad(audio)
+                
+                self.update_status("Transcribing audio...")
+                self.update_progress(30)
+                
+                out = self._asr_pipe(voiced.copy(), return_timestamps=True)
+                duration = len(voiced) / 16000
+                result = {
+                    "text": out["text"],
+                    "segments": [
+                        {"start": chunk["timestamp"][0] or 0.0,
+                         "end": chunk["timestamp"][1] if chunk["timestamp"][1] is not None else duration,
+                         "text": chunk["text"]}
+                        for chunk in out.get("chunks", [])
+                    ]
+                }
+                self._restore_timestamps(result["segments"], spans)
+            elif FASTER_WHISPER_AVAILABLE:
+                # Standard transcription with faster-whisper
+                model = self._get_fw_model()
+                
+                self.update_status("Transcribing audio...")
+                self.update_progress(30)
+                
+                segments, info = model.transcribe(audio, beam_size=1, vad_filter=True)
+                
+                # Show each segment as soon as the decoder yields it
+                self._streamed = True
+                duration = max(info.duration, 1e-6)
+                streamed = []
+                for seg in segments:
+                    streamed.append(seg)
+                    self.root.after(0, self._append_segment, seg.start, seg.end, seg.text)
+                    self.update_progress(30 + 50 * min(seg.end / duration, 1.0))
+                segments = streamed
+                result = {
+                    "text": "".join(s.text for s in segments),
+                    "segments": [{"start": s.start, "end": s.end, "text": s.text} for s in segments],
+                    "language": info.language
+                }
             else:
                 # Standard transcription
-                import whisper
-                model = whisper.load_model("base")
+                if _whisper is None:
+                    raise RuntimeError("whisper not installed")
+                if self._whisper_model is None:
+                    self._whisper_model = _whisper.load_model("base", device=self._whisper_device)
+                model = self._whisper_model
+                
+                self.update_status("Detecting speech...")
+                voiced, spans = self._apply_vad(audio)
                 
                 self.update_status("Transcribing audio...")
                 self.update_progress(30)
                 
                 # Perform transcription
                 result = model.transcribe(
-                    audio_file,
+                    voiced,
                     language=None,
                     task="transcribe",
-                    verbose=False
+                    verbose=False,
+                    fp16=self._whisper_device == "cuda"
                 )
+                self._restore_timestamps(result["segments"], spans)
+            
+            # Normalize segments once so consumers use attribute access
+            if 'segments' in result:
+                result['segments'] = [
+                    Segment(s.get('start', 0.0), s.get('end', 0.0), s.get('speaker', 'Unknown'), s.get('text', ''))
+                    for s in result['segments']
+                ]
             
             self.update_progress(80)
             self.update_status("Saving results...")
@@ -999,6 +1246,248 @@ class AudioTranscriberGUI:
             error_msg = f"Transcription failed: {str(e)}"
             self.root.after(0, self._transcription_error, error_msg)
     
+    def _load_audio(self, audio_file):
+        """Decode an audio file in-process to a 16 kHz mono float32 array"""
+        import numpy as np
+        
+        ext = os.path.splitext(audio_file)[1].lower()
+        if ext in ('.wav', '.flac'):
+            import soundfile as sf
+            try:
+                with sf.SoundFile(audio_file) as f:
+                    if f.samplerate == 16000 and f.channels == 1:
+                        # Already in Whisper's format (e.g. our own recordings): read straight into the buffer
+                        return f.read(dtype='float32', out=self._audio_buffer(f.frames))
+                    audio, sr = f.read(dtype='float32'), f.samplerate
+            except RuntimeError:
+                return self._load_audio_ffmpeg(audio_file)
+            
+            if audio.ndim > 1:
+                audio = audio.mean(axis=1)
+            if sr != 16000:
+                from math import gcd
+                from scipy.signal import resample_poly
+                g = gcd(sr, 16000)
+                audio = resample_poly(audio, 16000 // g, sr // g)
+            return np.ascontiguousarray(audio, dtype=np.float32)
+        
+        try:
+            import av
+        except ImportError:
+            return self._load_audio_ffmpeg(audio_file)
+        
+        # libavformat/libswresample decode, downmix and resample without spawning ffmpeg
+        resampler = av.AudioResampler(format='flt', layout='mono', rate=16000)
+        chunks = []
+        with av.open(audio_file) as container:
+            for frame in container.decode(audio=0):
+                chunks.extend(out.to_ndarray().reshape(-1) for out in resampler.resample(frame))
+        chunks.extend(out.to_ndarray().reshape(-1) for out in resampler.resample(None))
+        if not chunks:
+            return np.zeros(0, dtype=np.float32)
+        return np.concatenate(chunks, out=self._audio_buffer(sum(len(c) for c in chunks)))
+    
+    def _audio_buffer(self, n):
+        """Return an n-sample float32 view of a decode buffer reused across jobs
+        
+        Jobs run one at a time on the worker, so each decode can overwrite the
+        previous one. On CUDA the buffer is page-locked for faster host-to-device
+        copies, unless it would exceed PINNED_AUDIO_MAX_SAMPLES.
+        """
+        import numpy as np
+        
+        if self._audio_buf is None or len(self._audio_buf) < n:
+            size = max(n, 30 * 16000)
+            if self._device == "cuda" and size <= PINNED_AUDIO_MAX_SAMPLES:
+                import torch
+                self._audio_buf = torch.empty(size, dtype=torch.float32).pin_memory().numpy()
+            else:
+                self._audio_buf = np.empty(size, dtype=np.float32)
+        return self._audio_buf[:n]
+    
+    def _apply_vad(self, audio):
+        """Keep only voiced regions (Silero VAD) so Whisper skips silence
+        
+        Returns the voiced waveform and a list of (voiced_start, original_start)
+        offsets in seconds, or None when nothing was removed.
+        """
+        import numpy as np
+        import torch
+        
+        if self._vad is None:
+            try:
+                vad_model, utils = torch.hub.load('snakers4/silero-vad', 'silero_vad', trust_repo=True)
+                self._vad = (vad_model, utils[0])
+            except Exception as e:
+                print(f"Warning: Could not load Silero VAD, transcribing full audio: {e}")
+                self._vad = False
+        if not self._vad:
+            return audio, None
+        
+        vad_model, get_speech_timestamps = self._vad
+        speech = get_speech_timestamps(torch.from_numpy(audio), vad_model, sampling_rate=16000)
+        if not speech:
+            return audio, None
+        
+        pieces = []
+        spans = []
+        voiced_pos = 0
+        for ts in speech:
+            spans.append((voiced_pos / 16000, ts['start'] / 16000))
+            pieces.append(audio[ts['start']:ts['end']])
+            voiced_pos += ts['end'] - ts['start']
+        return np.concatenate(pieces), spans
+    
+    def _restore_timestamps(self, segments, spans):
+        """Shift segment times from the voiced-only timeline back onto the original audio"""
+        if not spans:
+            return
+        import bisect
+        voiced_starts = [voiced for voiced, _ in spans]
+        
+        def shift(t, is_end):
+            # An end time on a span boundary belongs to the span before it
+            find = bisect.bisect_left if is_end else bisect.bisect_right
+            i = max(find(voiced_starts, t) - 1, 0)
+            return t + spans[i][1] - spans[i][0]
+        
+        for segment in segments:
+            segment['start'] = shift(segment['start'], False)
+            segment['end'] = shift(segment['end'], True)
+    
+    def _load_audio_ffmpeg(self, audio_file):
+        """Decode through an ffmpeg subprocess (used when no in-process decoder can read the file)"""
+        if _whisper is None:
+            raise RuntimeError("whisper not installed")
+        return _whisper.load_audio(audio_file)
+    
+    def _append_segment(self, start, end, text):
+        """Append one decoded segment to the transcript tab (runs on the Tk thread)"""
+        self.full_transcription_text.insert(tk.END, f"[{start:.2f}s - {end:.2f}s] Unknown: {text}\n")
+        self.full_transcription_text.see(tk.END)
+    
+    def _get_fw_model(self):
+        """Load the faster-whisper model on first use and keep it for later runs"""
+        if self._fw_model is None:
+            if self._device == "cuda":
+                self._fw_model = WhisperModel("base", device="cuda", compute_type="float16")
+            else:
+                self._fw_model = WhisperModel("base", device="cpu", compute_type="int8",
+                                              cpu_threads=os.cpu_count() or 4)
+        return self._fw_model
+    
+    def _use_asr_pipeline(self, backend="auto"):
+        """True when the transformers pipeline should transcribe instead of faster-whisper
+        
+        backend is the Settings > Whisper backend choice. Automatic prefers the INT8
+        OpenVINO or ONNX Runtime export on CPU; elsewhere the pipeline is only the
+        fallback for installs without faster-whisper.
+        """
+        if not TRANSFORMERS_AVAILABLE:
+            return False
+        if backend == "pipeline":
+            return True
+        if backend == "faster-whisper":
+            return not FASTER_WHISPER_AVAILABLE
+        if self._device == "cpu" and (OPENVINO_AVAILABLE or ONNX_WHISPER_AVAILABLE):
+            return True
+        return not FASTER_WHISPER_AVAILABLE
+    
+    def _ensure_onnx_whisper(self):
+        """Export whisper-base to ONNX and quantize it to INT8 once, caching it under models/"""
+        if ONNX_INT8_MODEL_DIR.exists():
+            return ONNX_INT8_MODEL_DIR
+        
+        from optimum.onnxruntime import ORTModelForSpeechSeq2Seq, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        from transformers import WhisperProcessor
+        
+        def export(save_dir):
+            model = ORTModelForSpeechSeq2Seq.from_pretrained("openai/whisper-base", export=True)
+            model.save_pretrained(ONNX_MODEL_DIR)
+            
+            # Dynamic quantization: weights become INT8, activations are quantized on the fly
+            qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=True)
+            for onnx_file in ONNX_MODEL_DIR.glob("*.onnx"):
+                quantizer = ORTQuantizer.from_pretrained(ONNX_MODEL_DIR, file_name=onnx_file.name)
+                quantizer.quantize(save_dir=save_dir, quantization_config=qconfig)
+            
+            model.config.save_pretrained(save_dir)
+            model.generation_config.save_pretrained(save_dir)
+            WhisperProcessor.from_pretrained("openai/whisper-base").save_pretrained(save_dir)
+        
+        return _export_model_dir(ONNX_INT8_MODEL_DIR, export)
+    
+    def _get_asr_pipeline(self):
+        """Build a chunked, batched transformers ASR pipeline for Whisper base
+        
+        On CPU an INT8 OpenVINO or ONNX Runtime export is used when available;
+        otherwise the PyTorch checkpoint runs on the detected device.
+        """
+        from transformers import WhisperProcessor, pipeline as hf_pipeline
+        
+        if OPENVINO_AVAILABLE and self._device == "cpu":
+            from optimum.intel.openvino import OVModelForSpeechSeq2Seq
+            if not OPENVINO_MODEL_DIR.exists():
+                # Export and compress weights to INT8 once, then reuse from disk
+                def export(save_dir):
+                    model = OVModelForSpeechSeq2Seq.from_pretrained(
+                        "openai/whisper-base", export=True, load_in_8bit=True, compile=False)
+                    model.save_pretrained(save_dir)
+                    WhisperProcessor.from_pretrained("openai/whisper-base").save_pretrained(save_dir)
+                
+                _export_model_dir(OPENVINO_MODEL_DIR, export)
+            model = OVModelForSpeechSeq2Seq.from_pretrained(
+                OPENVINO_MODEL_DIR, ov_config={"PERFORMANCE_HINT": "LATENCY"})
+            processor = WhisperProcessor.from_pretrained(OPENVINO_MODEL_DIR)
+            return hf_pipeline("automatic-speech-recognition", model=model,
+                               tokenizer=processor.tokenizer,
+                               feature_extractor=processor.feature_extractor,
+                               chunk_length_s=30, stride_length_s=5, batch_size=8)
+        
+        if ONNX_WHISPER_AVAILABLE and self._device == "cpu":
+            from optimum.onnxruntime import ORTModelForSpeechSeq2Seq
+            model_dir = self._ensure_onnx_whisper()
+            file_names = {
+                "encoder_file_name": "encoder_model_quantized.onnx",
+                "decoder_file_name": "decoder_model_quantized.onnx"
+            }
+            if (model_dir / "decoder_with_past_model_quantized.onnx").exists():
+                file_names["decoder_with_past_file_name"] = "decoder_with_past_model_quantized.onnx"
+            else:
+                file_names["use_cache"] = False
+            
+            model = ORTModelForSpeechSeq2Seq.from_pretrained(model_dir, **file_names)
+            processor = WhisperProcessor.from_pretrained(model_dir)
+            return hf_pipeline("automatic-speech-recognition", model=model,
+                               tokenizer=processor.tokenizer,
+                               feature_extractor=processor.feature_extractor,
+                               chunk_length_s=30, stride_length_s=5, batch_size=8)
+        
+        import torch
+        return hf_pipeline("automatic-speech-recognition", model="openai/whisper-base",
+                           chunk_length_s=30, stride_length_s=5, batch_size=8,
+                           device=self._device,
+                           torch_dtype=torch.float16 if self._device == "cuda" else torch.float32)
+    
+    def unload_models(self):
+        """Drop cached models so their memory can be reclaimed"""
+        if self.is_transcribing:
+            messagebox.showwarning("Warning", "Cannot unload models while transcription is in progress!")
+            return
+        
+        self._fw_model = None
+        self._whisper_model = None
+        self._asr_pipe = None
+        # The diarizer's models live in speaker_diarization's shared caches; close() frees those too
+        if self._diarizer is not None:
+            self._diarizer.close()
+        self._diarizer = None
+        self._diarizer_token = None
+        self._audio_buf = None
+        gc.collect()
+        self.update_status("Models unloaded")
+    
     def _transcription_error(self, error_message):
         """Handle transcription error in main thread"""
         self.is_transcribing = False
@@ -1013,20 +1502,16 @@ class AudioTranscriberGUI:
         self.transcribe_button.config(text="Start Transcription", state="normal")
         self.update_progress(0)
         
-        # Clear both tabs
-        self.full_transcription_text.delete(1.0, tk.END)
+        # Clear both tabs (a streamed transcript is already complete)
+        if not self._streamed:
+            self.full_transcription_text.delete(1.0, tk.END)
         self.summary_text.delete(1.0, tk.END)
         
         # Display full transcription with timestamps
         if isinstance(result, dict) and 'segments' in result:
             # Speaker diarization results
-            full_text = ""
-            for segment in result['segments']:
-                speaker = segment.get('speaker', 'Unknown')
-                start_time = segment.get('start', 0)
-                end_time = segment.get('end', 0)
-                text = segment.get('text', '')
-                full_text += f"[{start_time:.2f}s - {end_time:.2f}s] {speaker}: {text}\n"
+            fmt = "[{:.2f}s - {:.2f}s] {}: {}\n".format
+            full_text = "".join(fmt(seg.start, seg.end, seg.speaker, seg.text) for seg in result['segments'])
             
             # Generate summary
             summary = self.generate_summary(result)
@@ -1036,18 +1521,15 @@ class AudioTranscriberGUI:
             summary = self.generate_simple_summary(full_text)
         
         # Populate tabs
-        self.full_transcription_text.insert(1.0, full_text)
+        if not self._streamed:
+            self.full_transcription_text.insert(1.0, full_text)
         self.summary_text.insert(1.0, summary)
         
-        # Show success message
-        messagebox.showinfo("Transcription Complete", 
-                          f"Transcription completed successfully!\n\nOutput saved to: {output_file}")
+        self.flash_status(f"Done → {output_file}")
     
     def save_transcription(self, result, audio_file_path, output_format):
         """Save transcription results to file"""
-        # Create Transcriptions directory
-        transcriptions_dir = Path("Transcriptions")
-        transcriptions_dir.mkdir(exist_ok=True)
+        transcriptions_dir = self._transcriptions_dir
         
         # Get base filename
         base_name = Path(audio_file_path).stem
@@ -1057,14 +1539,10 @@ class AudioTranscriberGUI:
         
             if isinstance(result, dict) and 'segments' in result:
                 # Speaker diarization results
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    for segment in result['segments']:
-                        speaker = segment.get('speaker', 'Unknown')
-                        start_time = segment.get('start', 0)
-                        end_time = segment.get('end', 0)
-                        text = segment.get('text', '')
-                        
-                        f.write(f"[{start_time:.2f}s - {end_time:.2f}s] {speaker}: {text}\n")
+                fmt = "[{:.2f}s - {:.2f}s] {}: {}\n".format
+                lines = [fmt(seg.start, seg.end, seg.speaker, seg.text) for seg in result['segments']]
+                with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                    f.writelines(lines)
             else:
                 # Standard transcription results
                 with open(output_file, 'w', encoding='utf-8') as f:
@@ -1091,16 +1569,16 @@ class AudioTranscriberGUI:
         
         # Basic statistics
         total_segments = len(segments)
-        total_duration = max(segment.get('end', 0) for segment in segments) if segments else 0
+        total_duration = max(segment.end for segment in segments) if segments else 0
         
         # Speaker analysis
         speakers = {}
         total_words = 0
         
         for segment in segments:
-            speaker = segment.get('speaker', 'Unknown')
-            text = segment.get('text', '')
-            duration = segment.get('end', 0) - segment.get('start', 0)
+            speaker = segment.speaker
+            text = segment.text
+            duration = segment.end - segment.start
             
             if speaker not in speakers:
                 speakers[speaker] = {'segments': 0, 'words': 0, 'duration': 0}
@@ -1129,9 +1607,9 @@ class AudioTranscriberGUI:
         # Show first few segments
         preview_segments = segments[:3]
         for i, segment in enumerate(preview_segments, 1):
-            speaker = segment.get('speaker', 'Unknown')
-            text = segment.get('text', '')[:100]  # First 100 characters
-            if len(segment.get('text', '')) > 100:
+            speaker = segment.speaker
+            text = segment.text[:100]  # First 100 characters
+            if len(segment.text) > 100:
                 text += "..."
             summary += f"{i}. [{speaker}]: {text}\n"
         
@@ -1196,7 +1674,7 @@ class AudioTranscriberGUI:
     
     def clear_all(self):
         """Clear all fields and results"""
-        self.audio_file_path.set("")
+        self._set_audio_file("")
         self.full_transcription_text.delete(1.0, tk.END)
         self.summary_text.delete(1.0, tk.END)
         self.update_progress(0)
@@ -7,9 +7,11 @@ A modern GUI for audio transcription using OpenAI Whisper with speaker diarizati
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import threading
+import io
 import os
 import platform
 import subprocess
+import time
 from pathlib import Path
 
 # Try to import audio recording functionality
@@ -19,12 +21,22 @@ try:
 except ImportError:
     AUDIO_RECORDING_AVAILABLE = False
 
-# Try to import speaker diarization
-try:
-    from speaker_diarization import transcribe_with_speaker_diarization
-    SPEAKER_DIARIZATION_AVAILABLE = True
-except ImportError:
-    SPEAKER_DIARIZATION_AVAILABLE = False
+# Speaker diarization pulls in torch/pyannote, so it is imported in the
+# background once the window is up (see AudioTranscriberGUI._late_import).
+# None means the import has not finished yet.
+SPEAKER_DIARIZATION_AVAILABLE = None
+
+SPEAKER_COLORS = ['#2563eb', '#10b981', '#ef4444', '#f59e0b', '#059669']
+
+_TRANSCRIPTIONS_DIR = Path("Transcriptions")
+
+
+def _ts(t, sep=","):
+    """Format seconds as an SRT (HH:MM:SS,mmm) or VTT (sep='.') timestamp"""
+    h, r = divmod(int(t * 1000), 3_600_000)
+    m, r = divmod(r, 60_000)
+    s, ms = divmod(r, 1000)
+    return f"{h:02d}:{m:02d}:{s:02d}{sep}{ms:03d}"
 
 
 class AudioTranscriberGUI:
@@ -41,6 +53,17 @@ class AudioTranscriberGUI:
         self.detect_speakers = tk.BooleanVar()
         self.is_recording = False
         self.is_transcribing = False
+        self._late_imported = False
+        self._transcribe_with_speakers = None
+        self._cuda_device_count = 0
+        self._transcriptions_exists_cache = (0.0, False)  # (checked at, exists)
+        
+        # Widgets created by the cards; None until built (level meter needs PyAudio)
+        self.audio_level_canvas = None
+        self.audio_level_progress = None
+        self.audio_level_label = None
+        self.progress_canvas = None
+        self.progress_fill = None
         
         # Model options
         self.model_options = [
@@ -78,6 +101,42 @@ class AudioTranscriberGUI:
         ]
         
         self.setup_ui()
+        self.root.after(0, self._start_late_import)
+    
+    def _start_late_import(self):
+        """Import heavy modules off the UI thread once the mainloop is running"""
+        import_thread = threading.Thread(target=self._late_import)
+        import_thread.daemon = True
+        import_thread.start()
+    
+    def _late_import(self):
+        """Import speaker diarization (torch, pyannote) in a background thread"""
+        global SPEAKER_DIARIZATION_AVAILABLE
+        try:
+            from speaker_diarization import transcribe_with_speaker_diarization
+            self._transcribe_with_speakers = transcribe_with_speaker_diarization
+            SPEAKER_DIARIZATION_AVAILABLE = True
+        except ImportError:
+            SPEAKER_DIARIZATION_AVAILABLE = False
+        
+        try:
+            import torch
+            if torch.cuda.is_available():
+                self._cuda_device_count = torch.cuda.device_count()
+        except ImportError:
+            pass
+        self.root.after(0, self._late_import_complete)
+    
+    def _late_import_complete(self):
+        """Enable speaker detection once the background import has finished"""
+        self._late_imported = True
+        if SPEAKER_DIARIZATION_AVAILABLE:
+            self.speaker_checkbox.config(state='normal')
+        
+        menu = self.device_dropdown['menu']
+        for i in range(self._cuda_device_count):
+            label = f"CUDA:{i}"
+            menu.add_command(label=label, command=tk._setit(self.device_var, label))
         
     def setup_ui(self):
         # Configure modern styling with colors
@@ -192,27 +251,28 @@ class AudioTranscriberGUI:
         # Step 3: Results Card
         self.create_results_card(parent, colors)
     
-    def create_audio_input_card(self, parent, colors):
-        """Create the audio input card"""
-        # Card container
+    def _make_card(self, parent, colors, title, expand=False, title_pady=20):
+        """Build the shared card chrome (frame, shadow, title) and return its content frame"""
         card_frame = tk.Frame(parent, bg=colors['surface'], relief='flat', bd=0)
-        card_frame.pack(fill=tk.X, pady=(0, 20))
+        if expand:
+            card_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
+        else:
+            card_frame.pack(fill=tk.X, pady=(0, 20))
         
         # Add subtle shadow effect with border
-        shadow_frame = tk.Frame(parent, bg=colors['border'], height=2)
-        shadow_frame.pack(fill=tk.X, pady=(0, 18))
+        tk.Frame(parent, bg=colors['border'], height=2).pack(fill=tk.X, pady=(0, 18))
         
-        # Card content
         content_frame = tk.Frame(card_frame, bg=colors['surface'])
         content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
-        # Card title
-        title_frame = tk.Frame(content_frame, bg=colors['surface'])
-        title_frame.pack(fill=tk.X, pady=(0, 20))
-        
-        tk.Label(title_frame, text="🎤 Audio Input", 
+        tk.Label(content_frame, text=title, 
                 font=('Segoe UI', 16, 'bold'), 
-                fg=colors['text'], bg=colors['surface']).pack(side=tk.LEFT)
+                fg=colors['text'], bg=colors['surface']).pack(anchor=tk.W, pady=(0, title_pady))
+        return content_frame
+    
+    def create_audio_input_card(self, parent, colors):
+        """Create the audio input card"""
+        content_frame = self._make_card(parent, colors, "🎤 Audio Input")
         
         # Input options
         input_frame = tk.Frame(content_frame, bg=colors['surface'])
@@ -311,25 +371,7 @@ class AudioTranscriberGUI:
     
     def create_settings_card(self, parent, colors):
         """Create the transcription settings card"""
-        # Card container
-        card_frame = tk.Frame(parent, bg=colors['surface'], relief='flat', bd=0)
-        card_frame.pack(fill=tk.X, pady=(0, 20))
-        
-        # Add subtle shadow effect with border
-        shadow_frame = tk.Frame(parent, bg=colors['border'], height=2)
-        shadow_frame.pack(fill=tk.X, pady=(0, 18))
-        
-        # Card content
-        content_frame = tk.Frame(card_frame, bg=colors['surface'])
-        content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
-        # Card title
-        title_frame = tk.Frame(content_frame, bg=colors['surface'])
-        title_frame.pack(fill=tk.X, pady=(0, 20))
-        
-        tk.Label(title_frame, text="⚙️ Transcription Settings", 
-                font=('Segoe UI', 16, 'bold'), 
-                fg=colors['text'], bg=colors['surface']).pack(side=tk.LEFT)
+        content_frame = self._make_card(parent, colors, "⚙️ Transcription Settings")
         
         # Settings grid
         settings_frame = tk.Frame(content_frame, bg=colors['surface'])
@@ -371,6 +413,21 @@ class AudioTranscriberGUI:
                             relief='solid', bd=1, width=12)
         lang_dropdown.pack(anchor=tk.W, pady=(5, 0))
         
+        # Device selection (CUDA devices are added once torch has been imported)
+        device_frame = tk.Frame(row1, bg=colors['surface'])
+        device_frame.pack(side=tk.LEFT, padx=(0, 30))
+        
+        tk.Label(device_frame, text="Device:", 
+                font=('Segoe UI', 11, 'bold'), 
+                fg=colors['text'], bg=colors['surface']).pack(anchor=tk.W)
+        
+        self.device_var = tk.StringVar(value="CPU")
+        self.device_dropdown = tk.OptionMenu(device_frame, self.device_var, "CPU")
+        self.device_dropdown.config(bg=colors['surface'], fg=colors['text'], 
+                                   activebackground=colors['primary'], activeforeground='white',
+                                   relief='solid', bd=1, width=8)
+        self.device_dropdown.pack(anchor=tk.W, pady=(5, 0))
+        
         # Output format
         output_frame = tk.Frame(row1, bg=colors['surface'])
         output_frame.pack(side=tk.LEFT)
@@ -381,6 +438,7 @@ class AudioTranscriberGUI:
         
         output_options = ["Plain Text", "SRT Subtitles", "WebVTT Subtitles"]
         output_var = tk.StringVar(value="Plain Text")
+        self.output_format_var = output_var
         output_dropdown = tk.OptionMenu(output_frame, output_var, *output_options)
         output_dropdown.config(bg=colors['surface'], fg=colors['text'], 
                               activebackground=colors['primary'], activeforeground='white',
@@ -400,7 +458,8 @@ class AudioTranscriberGUI:
                                               font=('Segoe UI', 10),
                                               fg=colors['text'], bg=colors['surface'],
                                               activebackground=colors['surface'],
-                                              selectcolor=colors['primary'])
+                                              selectcolor=colors['primary'],
+                                              state='disabled')
         self.speaker_checkbox.pack(anchor=tk.W)
         
         # View transcriptions button
@@ -421,25 +480,8 @@ class AudioTranscriberGUI:
     
     def create_results_card(self, parent, colors):
         """Create the results card"""
-        # Card container
-        card_frame = tk.Frame(parent, bg=colors['surface'], relief='flat', bd=0)
-        card_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
-        
-        # Add subtle shadow effect with border
-        shadow_frame = tk.Frame(parent, bg=colors['border'], height=2)
-        shadow_frame.pack(fill=tk.X, pady=(0, 18))
-        
-        # Card content
-        content_frame = tk.Frame(card_frame, bg=colors['surface'])
-        content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
-        # Card title
-        title_frame = tk.Frame(content_frame, bg=colors['surface'])
-        title_frame.pack(fill=tk.X, pady=(0, 15))
-        
-        tk.Label(title_frame, text="📝 Transcription Results", 
-                font=('Segoe UI', 16, 'bold'), 
-                fg=colors['text'], bg=colors['surface']).pack(side=tk.LEFT)
+        content_frame = self._make_card(parent, colors, "📝 Transcription Results",
+                                        expand=True, title_pady=15)
         
         # Progress bar
         progress_frame = tk.Frame(content_frame, bg=colors['surface'])
@@ -470,6 +512,10 @@ class AudioTranscriberGUI:
                                                      wrap=tk.WORD)
         self.results_text.pack(fill=tk.BOTH, expand=True)
         
+        # Speaker colors, cycled by order of first appearance
+        for i, color in enumerate(SPEAKER_COLORS):
+            self.results_text.tag_configure(f'speaker_{i}', foreground=color)
+        
         # Configure grid weights for resizing
         parent.columnconfigure(0, weight=1)
         parent.rowconfigure(0, weight=1)
@@ -488,25 +534,22 @@ class AudioTranscriberGUI:
     def update_progress(self, value):
         """Update progress bar"""
         self.progress_var.set(value)
-        if hasattr(self, 'progress_canvas') and hasattr(self, 'progress_fill'):
+        if self.progress_fill is not None:
             width = int((value / 100.0) * 400)
             self.progress_canvas.coords(self.progress_fill, 0, 0, width, 8)
     
     def update_audio_level(self, level):
         """Update the audio level display"""
-        if hasattr(self, 'audio_level_canvas') and hasattr(self, 'audio_level_progress'):
+        if self.audio_level_progress is not None:
             self.root.after(0, self._update_audio_level_ui, level)
     
     def _update_audio_level_ui(self, level):
         """Update audio level UI elements (called from main thread)"""
-        try:
-            if hasattr(self, 'audio_level_canvas') and hasattr(self, 'audio_level_progress'):
-                # Update canvas-based progress bar
-                width = int((level / 100.0) * 80)
-                self.audio_level_canvas.coords(self.audio_level_progress, 0, 0, width, 16)
+        if self.audio_level_progress is not None:
+            # Update canvas-based progress bar
+            width = int((level / 100.0) * 80)
+            self.audio_level_canvas.coords(self.audio_level_progress, 0, 0, width, 16)
             self.audio_level_label.config(text=f"{level:.1f}%")
-        except:
-            pass  # Ignore errors if widgets don't exist yet
     
     def start_recording(self):
         """Start recording audio from microphone"""
@@ -563,9 +606,8 @@ class AudioTranscriberGUI:
             self.update_status("Recording completed")
             
             # Reset audio level display
-            if hasattr(self, 'audio_level_canvas') and hasattr(self, 'audio_level_progress'):
+            if self.audio_level_progress is not None:
                 self.audio_level_canvas.coords(self.audio_level_progress, 0, 0, 0, 16)
-            if hasattr(self, 'audio_level_label'):
                 self.audio_level_label.config(text="0%")
             
             # Update the file path to the saved recording
@@ -602,9 +644,8 @@ class AudioTranscriberGUI:
                 self.update_status("Recording completed")
                 
                 # Reset audio level display
-                if hasattr(self, 'audio_level_canvas') and hasattr(self, 'audio_level_progress'):
+                if self.audio_level_progress is not None:
                     self.audio_level_canvas.coords(self.audio_level_progress, 0, 0, 0, 16)
-                if hasattr(self, 'audio_level_label'):
                     self.audio_level_label.config(text="0%")
                 
                 # Update the file path to the saved recording
@@ -644,8 +685,13 @@ class AudioTranscriberGUI:
     
     def view_transcriptions(self):
         """Open the Transcriptions folder"""
-        transcriptions_dir = Path("Transcriptions")
-        if transcriptions_dir.exists():
+        transcriptions_dir = _TRANSCRIPTIONS_DIR
+        checked_at, exists = self._transcriptions_exists_cache
+        now = time.monotonic()
+        if now - checked_at > 2.0:
+            exists = transcriptions_dir.exists()
+            self._transcriptions_exists_cache = (now, exists)
+        if exists:
             if platform.system() == "Windows":
                 os.startfile(str(transcriptions_dir))
             elif platform.system() == "Darwin":  # macOS
@@ -733,6 +779,10 @@ class AudioTranscriberGUI:
             messagebox.showwarning("Warning", "Transcription is already in progress!")
             return
         
+        if not self._late_imported:
+            messagebox.showinfo("Please Wait", "Still loading models… try again in a moment.")
+            return
+        
         # Check if audio file is selected
         audio_file = self.audio_file_path.get()
         if not audio_file:
@@ -748,6 +798,7 @@ class AudioTranscriberGUI:
         self.is_transcribing = True
         self.transcribe_button.config(text="Transcribing...", state="disabled")
         self.update_progress(0)
+        self.results_text.delete(1.0, tk.END)
         
         transcription_thread = threading.Thread(target=self._transcribe_audio_thread)
         transcription_thread.daemon = True
@@ -758,6 +809,9 @@ class AudioTranscriberGUI:
         try:
             audio_file = self.audio_file_path.get()
             detect_speakers = self.detect_speakers.get()
+            output_format = {"SRT Subtitles": "srt",
+                             "WebVTT Subtitles": "vtt"}.get(self.output_format_var.get(), "txt")
+            device = self.device_var.get().lower()  # "cpu" or "cuda:N"
             
             self.update_status("Loading Whisper model...")
             self.update_progress(10)
@@ -767,17 +821,18 @@ class AudioTranscriberGUI:
                 self.update_status("Loading speaker diarization model...")
                 hf_token = self.hf_token.get().strip() if self.hf_token.get().strip() else None
                 
-                result = transcribe_with_speaker_diarization(
+                result = self._transcribe_with_speakers(
                     audio_file, 
                     "base", 
                     None, 
                     "transcribe", 
-                    hf_token
+                    hf_token,
+                    device=device
                 )
             else:
                 # Standard transcription
                 import whisper
-                model = whisper.load_model("base")
+                model = whisper.load_model("base", device=device)
                 
                 self.update_status("Transcribing audio...")
                 self.update_progress(30)
@@ -787,14 +842,28 @@ class AudioTranscriberGUI:
                     audio_file,
                     language=None,
                     task="transcribe",
-                    verbose=False
+                    verbose=False,
+                    fp16=device != "cpu"
                 )
             
             self.update_progress(80)
             self.update_status("Saving results...")
             
             # Save results
-            output_file = self.save_transcription(result, audio_file, "txt")
+            output_file = self.save_transcription(result, audio_file, output_format)
+            
+            # Build the transcript as alternating text/tag arguments for one Text.insert
+            chunks = []
+            if isinstance(result, dict) and 'segments' in result:
+                speaker_tags = {}
+                for segment in result['segments']:
+                    speaker = segment.get('speaker', 'Unknown')
+                    if speaker not in speaker_tags:
+                        speaker_tags[speaker] = f"speaker_{len(speaker_tags) % len(SPEAKER_COLORS)}"
+                    chunks.extend((f"[{speaker}]: {segment['text']}\n", speaker_tags[speaker]))
+            else:
+                chunks.extend((result.get('text', 'No transcription available'), ()))
+            self.root.after(0, self._show_transcript, chunks)
             
             self.update_progress(100)
             self.update_status("Transcription completed!")
@@ -820,50 +889,59 @@ class AudioTranscriberGUI:
         self.transcribe_button.config(text="Start Transcription", state="normal")
         self.update_progress(0)
         
-        # Display results
-        if isinstance(result, dict) and 'segments' in result:
-            # Speaker diarization results
-            text = ""
-            for segment in result['segments']:
-                speaker = segment.get('speaker', 'Unknown')
-                text += f"[{speaker}]: {segment['text']}\n"
-        else:
-            # Standard transcription results
-            text = result.get('text', 'No transcription available')
-        
-        self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(1.0, text)
-        
         # Show success message
         messagebox.showinfo("Transcription Complete", 
                           f"Transcription completed successfully!\n\nOutput saved to: {output_file}")
     
+    def _show_transcript(self, chunks):
+        """Insert the whole transcript in one call (runs on the Tk thread)"""
+        self.results_text.insert(tk.END, *chunks)
+    
     def save_transcription(self, result, audio_file_path, output_format):
         """Save transcription results to file"""
         # Create Transcriptions directory
-        transcriptions_dir = Path("Transcriptions")
+        transcriptions_dir = _TRANSCRIPTIONS_DIR
         transcriptions_dir.mkdir(exist_ok=True)
+        self._transcriptions_exists_cache = (time.monotonic(), True)
         
         # Get base filename
         base_name = Path(audio_file_path).stem
         
-        if output_format == "txt":
+        segments = result.get('segments') if isinstance(result, dict) else None
+        buf = io.StringIO()
+        
+        if output_format in ("srt", "vtt") and segments:
+            output_file = transcriptions_dir / f"{base_name}_transcription.{output_format}"
+            sep = "," if output_format == "srt" else "."
+            if output_format == "vtt":
+                buf.write("WEBVTT\n\n")
+            
+            for i, segment in enumerate(segments, 1):
+                speaker = segment.get('speaker')
+                text = segment.get('text', '').strip()
+                if speaker:
+                    text = f"[{speaker}] {text}"
+                if output_format == "srt":
+                    buf.write(f"{i}\n")
+                buf.write(f"{_ts(segment.get('start', 0), sep)} --> {_ts(segment.get('end', 0), sep)}\n")
+                buf.write(f"{text}\n\n")
+        else:
             output_file = transcriptions_dir / f"{base_name}_transcription.txt"
             
-            if isinstance(result, dict) and 'segments' in result:
+            if segments:
                 # Speaker diarization results
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    for segment in result['segments']:
-                        speaker = segment.get('speaker', 'Unknown')
-                        start_time = segment.get('start', 0)
-                        end_time = segment.get('end', 0)
-                        text = segment.get('text', '')
-                        
-                        f.write(f"[{start_time:.2f}s - {end_time:.2f}s] {speaker}: {text}\n")
+                for segment in segments:
+                    speaker = segment.get('speaker', 'Unknown')
+                    start_time = segment.get('start', 0)
+                    end_time = segment.get('end', 0)
+                    text = segment.get('text', '')
+                    
+                    buf.write(f"[{start_time:.2f}s - {end_time:.2f}s] {speaker}: {text}\n")
             else:
                 # Standard transcription results
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(result.get('text', 'No transcription available'))
+                buf.write(result.get('text', 'No transcription available'))
+        
+        output_file.write_text(buf.getvalue(), encoding='utf-8')
         
         return output_file
     
@@ -7,11 +7,24 @@ Powered by OpenAI Whisper
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import threading
+import queue
+import time
+import hashlib
+import json
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+import io
 import os
 import sys
+import importlib.util
+import subprocess
 from pathlib import Path
-import whisper
-from speaker_diarization import SpeakerDiarizer
+import numpy as np
+
+# Whisper backends are imported when a model is first loaded; at startup only check
+# that one is installed. faster-whisper (CTranslate2) is preferred over openai-whisper
+FASTER_WHISPER_AVAILABLE = importlib.util.find_spec("faster_whisper") is not None
+WHISPER_AVAILABLE = importlib.util.find_spec("whisper") is not None
 
 # Try to import audio recorder, but make it optional
 try:
@@ -21,7 +34,221 @@ except ImportError:
     AudioRecorder = None
     AUDIO_RECORDING_AVAILABLE = False
 
+# Available models
+MODELS = [
+    ("Tiny (Fastest, ~1GB VRAM)", "tiny"),
+    ("Base (Balanced, ~1GB VRAM)", "base"),
+    ("Small (Good accuracy, ~2GB VRAM)", "small"),
+    ("Medium (High accuracy, ~5GB VRAM)", "medium"),
+    ("Large (Best accuracy, ~10GB VRAM)", "large"),
+    ("Turbo (Fast English-only, ~6GB VRAM)", "turbo")
+]
+
+# Common languages
+LANGUAGES = [
+    ("Auto-detect", ""),
+    ("English", "en"),
+    ("Spanish", "es"),
+    ("French", "fr"),
+    ("German", "de"),
+    ("Italian", "it"),
+    ("Portuguese", "pt"),
+    ("Russian", "ru"),
+    ("Chinese", "zh"),
+    ("Japanese", "ja"),
+    ("Korean", "ko"),
+    ("Arabic", "ar"),
+    ("Dutch", "nl"),
+    ("Polish", "pl"),
+    ("Turkish", "tr"),
+    ("Hindi", "hi")
+]
+
+# Tasks
+TASKS = [
+    ("Transcribe", "transcribe"),
+    ("Translate to English", "translate")
+]
+
+# Output formats
+OUTPUT_FORMATS = [
+    ("Plain Text (.txt)", "txt"),
+    ("SRT Subtitles (.srt)", "srt"),
+    ("WebVTT Subtitles (.vtt)", "vtt")
+]
+
+# Results of earlier runs in this session, keyed by a hash of the decoded audio
+CACHE_SIZE = 8
+
+# Environment checks remembered across launches
+ENV_CACHE_FILE = Path.home() / ".audiotranscriber" / "env.json"
+
+# Modern color scheme
+COLORS = {
+    'primary': '#2563eb',      # Modern Blue
+    'secondary': '#10b981',    # Modern Green
+    'accent': '#ef4444',       # Modern Red
+    'warning': '#f59e0b',      # Modern Orange
+    'success': '#059669',      # Modern Dark Green
+    'background': '#f8fafc',   # Light Gray Background
+    'surface': '#ffffff',      # White Cards
+    'text': '#1e293b',         # Dark Text
+    'text_light': '#64748b',   # Light Text
+    'border': '#e2e8f0',       # Light Border
+    'hover': '#f1f5f9'         # Hover Background
+}
+
+# Display strings shared by the settings comboboxes
+MODEL_DISPLAY = tuple(d for d, _ in MODELS)
+LANG_DISPLAY = tuple(d for d, _ in LANGUAGES)
+TASK_DISPLAY = tuple(d for d, _ in TASKS)
+OUTPUT_DISPLAY = tuple(d for d, _ in OUTPUT_FORMATS)
+
+# Display string -> value lookups for get_selected_values
+MODEL_BY_NAME = dict(MODELS)
+LANG_BY_NAME = dict(LANGUAGES)
+TASK_BY_NAME = dict(TASKS)
+OUTPUT_BY_NAME = dict(OUTPUT_FORMATS)
+
+
+@lru_cache(maxsize=4096)
+def _hms(total_seconds):
+    """Format a whole number of seconds as HH:MM:SS (adjacent segments share most values)"""
+    minutes, secs = divmod(total_seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+
+def compile_module(module, device="cpu"):
+    """Wrap a torch module with torch.compile, falling back to the eager module where compile fails
+    
+    torch.compile is lazy: errors surface on the first forward call rather than here,
+    so the returned wrapper catches them there and switches to the eager module for good.
+    """
+    import torch
+    
+    # CUDA graphs ("reduce-overhead") only help, and only work, on CUDA
+    mode = "reduce-overhead" if device == "cuda" else "default"
+    try:
+        compiled = torch.compile(module, mode=mode, fullgraph=False)
+    except Exception as e:
+        print(f"torch.compile unavailable, using eager mode: {e}")
+        return module
+    
+    class EagerFallback(torch.nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.compiled = compiled
+            self.eager = module
+            self.use_eager = False
+        
+        def forward(self, *args, **kwargs):
+            if not self.use_eager:
+                try:
+                    return self.compiled(*args, **kwargs)
+                except Exception as e:
+                    print(f"torch.compile failed, using eager mode: {e}")
+                    self.use_eager = True
+            return self.eager(*args, **kwargs)
+        
+        def __getattr__(self, name):
+            # Callers read model attributes (dims, specifications, ...) through the wrapper
+            try:
+                return super().__getattr__(name)
+            except AttributeError:
+                if name == "eager":
+                    raise
+                return getattr(self.eager, name)
+    
+    return EagerFallback()
+
+
+class TranscriberBackend:
+    """Whisper model wrapper: faster-whisper when installed, otherwise openai-whisper"""
+    
+    def __init__(self, model_size, device="cpu", compile_model=False):
+        # Neither backend runs reliably on MPS, so Apple GPUs transcribe on the CPU
+        self.device = "cuda" if device == "cuda" else "cpu"
+        self.compute_type = "float16" if self.device == "cuda" else "int8"
+        self.batch_size = 8 if self.device == "cuda" else 2
+        self.pipeline = None
+        cpu_threads = min(os.cpu_count() or 4, 16)
+        if FASTER_WHISPER_AVAILABLE:
+            import faster_whisper
+            self.model = faster_whisper.WhisperModel(model_size, device=self.device,
+                                                     compute_type=self.compute_type,
+                                                     cpu_threads=cpu_threads)
+            # Batched decoding of VAD chunks needs faster-whisper >= 1.1
+            if hasattr(faster_whisper, "BatchedInferencePipeline"):
+                self.pipeline = faster_whisper.BatchedInferencePipeline(model=self.model)
+        else:
+            import torch
+            import whisper
+            if self.device == "cpu":
+                torch.set_num_threads(cpu_threads)
+            self.model = whisper.load_model(model_size, device=self.device)
+            if compile_model:
+                self.model.encoder = compile_module(self.model.encoder, self.device)
+    
+    def transcribe(self, audio_file, language=None, task="transcribe", on_segment=None):
+        """Transcribe a file or 16 kHz float32 waveform, calling on_segment(segment) for each decoded segment"""
+        # Clips that fit in one 30 s window need no timestamp tokens or cross-window conditioning
+        short_clip = not isinstance(audio_file, str) and len(audio_file) < 30 * 16000
+        
+        if not FASTER_WHISPER_AVAILABLE:
+            # Greedy decoding at temperature 0, without the fallback temperature ladder
+            options = dict(language=language, task=task, verbose=False, temperature=0,
+                           condition_on_previous_text=False, no_speech_threshold=None,
+                           without_timestamps=short_clip)
+            if self.device == "cuda":
+                import torch
+                # A CUDA tensor makes whisper compute the log-mel spectrogram on the GPU
+                if isinstance(audio_file, str):
+                    import whisper
+                    audio_file = whisper.load_audio(audio_file)
+                # Pinned host memory lets the copy run asynchronously ahead of the encoder
+                audio_file = torch.from_numpy(audio_file).pin_memory().to(self.device, non_blocking=True)
+                with torch.autocast("cuda", dtype=torch.float16):
+                    result = self.model.transcribe(audio_file, **options)
+            else:
+                result = self.model.transcribe(audio_file, **options)
+            if on_segment:
+                for segment in result["segments"]:
+                    on_segment(segment)
+            return result
+        
+        if short_clip or self.pipeline is None:
+            segments, info = self.model.transcribe(audio_file, language=language, task=task,
+                                                   beam_size=1, vad_filter=True,
+                                                   without_timestamps=short_clip,
+                                                   condition_on_previous_text=False)
+        else:
+            # Speech chunks found by VAD go through the encoder/decoder batch_size at a time
+            segments, info = self.pipeline.transcribe(audio_file, language=language, task=task,
+                                                      beam_size=1, batch_size=self.batch_size)
+        result_segments = []
+        for seg in segments:
+            segment = {"start": seg.start, "end": seg.end, "text": seg.text}
+            result_segments.append(segment)
+            if on_segment:
+                on_segment(segment)
+        return {
+            "text": "".join(s["text"] for s in result_segments),
+            "segments": result_segments,
+            "language": info.language
+        }
+
+
 class AudioTranscriberGUI:
+    _FILETYPES = (
+        ("Audio files", "*.mp3 *.wav *.flac *.m4a *.mp4 *.avi *.mov *.mkv"),
+        ("MP3 files", "*.mp3"),
+        ("WAV files", "*.wav"),
+        ("FLAC files", "*.flac"),
+        ("M4A files", "*.m4a"),
+        ("All files", "*.*")
+    )
+    
     def __init__(self, root):
         self.root = root
         self.root.title("AudioTranscriber - Powered by OpenAI Whisper")
@@ -30,13 +257,33 @@ class AudioTranscriberGUI:
         
         # Variables
         self.audio_file_path = tk.StringVar()
-        self.selected_model = tk.StringVar(value="base")
-        self.selected_language = tk.StringVar()
-        self.selected_task = tk.StringVar(value="transcribe")
-        self.selected_output = tk.StringVar(value="txt")
+        self.selected_model = tk.StringVar(value=MODEL_DISPLAY[1])
+        self.selected_language = tk.StringVar(value=LANG_DISPLAY[0])
+        self.selected_task = tk.StringVar(value=TASK_DISPLAY[0])
+        self.selected_output = tk.StringVar(value=OUTPUT_DISPLAY[0])
         self.detect_speakers = tk.BooleanVar(value=False)
-        self.hf_token = tk.StringVar()
+        self.use_torch_compile = tk.BooleanVar(value=False)
+        self.hf_token = ""  # token saved this session; otherwise SpeakerDiarizer loads the stored one
         self.is_transcribing = False
+        self._streamed = False
+        self._pending_lines = []
+        self._model_cache = {}
+        self._model_lock = threading.Lock()
+        self._asr_cache = {}
+        self._diar_cache = {}
+        self._diarizer = None
+        self._diarizer_key = None
+        
+        # Compute device shared by Whisper and speaker diarization; detecting it imports
+        # torch, so _warm_model does that in the background and sets _device_ready
+        self.device = "cpu"
+        self._device_ready = threading.Event()
+        
+        # Output folders (resolved once; Transcriptions is created up front)
+        self._transcriptions_dir = Path("Transcriptions")
+        self._transcriptions_dir.mkdir(exist_ok=True)
+        self._transcriptions_dir_abs = self._transcriptions_dir.absolute()
+        self._recordings_dir_abs = Path("recordings").absolute()
         
         # Recording variables
         if AUDIO_RECORDING_AVAILABLE:
@@ -46,78 +293,98 @@ class AudioTranscriberGUI:
             self.audio_recorder = None
         self.is_recording = False
         self.recording_file = None
+        self.recorded_audio = None
         self.recording_format = tk.StringVar(value="wav")
+        self._level_last_ts = 0.0
+        self._last_level_px = 0
+        
+        # Level meter widgets (created by the audio input card when PyAudio is available)
+        self.audio_level_canvas = None
+        self.audio_level_progress = None
+        self.audio_level_label = None
+        self._last_progress_px = 0
+        self._last_progress_ts = 0.0
+        
+        # Latest progress/status from the transcription worker, applied by _pump_ui
+        self._ui_lock = threading.Lock()
+        self._ui_state = {"progress": 0, "status": ""}
+        self._ui_applied = dict(self._ui_state)
+        self._last_status = None
+        
+        # Updates from the recorder threads, applied on the Tk thread by _drain_ui
+        self._ui_queue = queue.Queue()
+        self._ui_handlers = {
+            "level": self._update_audio_level_ui,
+            "recording_saved": self._recording_saved,
+            "device": self._device_detected,
+        }
         
-        # Available models
-        self.models = [
-            ("Tiny (Fastest, ~1GB VRAM)", "tiny"),
-            ("Base (Balanced, ~1GB VRAM)", "base"),
-            ("Small (Good accuracy, ~2GB VRAM)", "small"),
-            ("Medium (High accuracy, ~5GB VRAM)", "medium"),
-            ("Large (Best accuracy, ~10GB VRAM)", "large"),
-            ("Turbo (Fast English-only, ~6GB VRAM)", "turbo")
-        ]
-        
-        # Common languages
-        self.languages = [
-            ("Auto-detect", ""),
-            ("English", "en"),
-            ("Spanish", "es"),
-            ("French", "fr"),
-            ("German", "de"),
-            ("Italian", "it"),
-            ("Portuguese", "pt"),
-            ("Russian", "ru"),
-            ("Chinese", "zh"),
-            ("Japanese", "ja"),
-            ("Korean", "ko"),
-            ("Arabic", "ar"),
-            ("Dutch", "nl"),
-            ("Polish", "pl"),
-            ("Turkish", "tr"),
-            ("Hindi", "hi")
-        ]
-        
-        # Tasks
-        self.tasks = [
-            ("Transcribe", "transcribe"),
-            ("Translate to English", "translate")
-        ]
-        
-        # Output formats
-        self.output_formats = [
-            ("Plain Text (.txt)", "txt"),
-            ("SRT Subtitles (.srt)", "srt"),
-            ("WebVTT Subtitles (.vtt)", "vtt")
-        ]
+        # Load the default model in the background (while the UI is still being built)
+        threading.Thread(target=self._warm_model, daemon=True).start()
         
         self.setup_ui()
+        self.root.after(33, self._drain_ui)
+        self.root.after(100, self._pump_ui)
         
     def setup_ui(self):
         # Configure modern styling with colors
+        self._configure_styles()
+        
+        # Set main window background
+        self.root.configure(bg=COLORS['background'])
+        
+        # Create menu bar
+        menubar = tk.Menu(self.root, tearoff=0)
+        self.root.config(menu=menubar)
+        
+        # Settings menu
+        settings_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Settings", menu=settings_menu)
+        settings_menu.add_command(label="Hugging Face Authentication", command=self.open_hf_settings)
+        settings_menu.add_checkbutton(label="Enable torch.compile (first run slower)",
+                                      variable=self.use_torch_compile)
+        
+        # Main container with padding
+        main_container = tk.Frame(self.root, bg=COLORS['background'])
+        main_container.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        # Header section
+        header_frame = tk.Frame(main_container, bg=COLORS['background'])
+        header_frame.pack(fill=tk.X, pady=(0, 30))
+        
+        # Title
+        title_label = tk.Label(header_frame, text="AudioTranscriber", 
+                             font=('Segoe UI', 28, 'bold'), 
+                             fg=COLORS['primary'], bg=COLORS['background'])
+        title_label.pack()
+        
+        # Subtitle
+        subtitle_label = tk.Label(header_frame, text="Transform audio into text with AI-powered transcription", 
+                                 font=('Segoe UI', 14), 
+                                 fg=COLORS['text_light'], bg=COLORS['background'])
+        subtitle_label.pack(pady=(5, 0))
+        
+        # Compute device (filled in once _warm_model has detected it)
+        self.device_label = tk.Label(header_frame, text="Device: detecting...", 
+                                     font=('Segoe UI', 10), 
+                                     fg=COLORS['text_light'], bg=COLORS['background'])
+        self.device_label.pack(pady=(5, 0))
+        
+        # Create main workflow cards
+        self.create_workflow_cards(main_container)
+    
+    def _configure_styles(self):
+        """Configure the ttk button styles (once per process)"""
+        if getattr(AudioTranscriberGUI, "_styles_done", False):
+            return
         style = ttk.Style()
         style.theme_use('clam')
         
-        # Modern color scheme
-        colors = {
-            'primary': '#2563eb',      # Modern Blue
-            'secondary': '#10b981',    # Modern Green
-            'accent': '#ef4444',       # Modern Red
-            'warning': '#f59e0b',      # Modern Orange
-            'success': '#059669',      # Modern Dark Green
-            'background': '#f8fafc',   # Light Gray Background
-            'surface': '#ffffff',      # White Cards
-            'text': '#1e293b',         # Dark Text
-            'text_light': '#64748b',   # Light Text
-            'border': '#e2e8f0',       # Light Border
-            'hover': '#f1f5f9'         # Hover Background
-        }
-        
         # Configure modern button styles
         style.configure('Primary.TButton', 
                        font=('Segoe UI', 11, 'bold'),
                        foreground='white',
-                       background=colors['primary'],
+                       background=COLORS['primary'],
                        padding=(20, 12),
                        borderwidth=0,
                        focuscolor='none')
@@ -125,7 +392,7 @@ class AudioTranscriberGUI:
         style.configure('Success.TButton', 
                        font=('Segoe UI', 10, 'bold'),
                        foreground='white',
-                       background=colors['success'],
+                       background=COLORS['success'],
                        padding=(16, 10),
                        borderwidth=0,
                        focuscolor='none')
@@ -133,7 +400,7 @@ class AudioTranscriberGUI:
         style.configure('Warning.TButton', 
                        font=('Segoe UI', 10, 'bold'),
                        foreground='white',
-                       background=colors['warning'],
+                       background=COLORS['warning'],
                        padding=(16, 10),
                        borderwidth=0,
                        focuscolor='none')
@@ -141,7 +408,7 @@ class AudioTranscriberGUI:
         style.configure('Accent.TButton', 
                        font=('Segoe UI', 10, 'bold'),
                        foreground='white',
-                       background=colors['accent'],
+                       background=COLORS['accent'],
                        padding=(16, 10),
                        borderwidth=0,
                        focuscolor='none')
@@ -159,110 +426,89 @@ class AudioTranscriberGUI:
         style.map('Accent.TButton',
                  background=[('active', '#dc2626')])
         
-        # Set main window background
-        self.root.configure(bg=colors['background'])
-        
-        # Create menu bar
-        menubar = tk.Menu(self.root, tearoff=0)
-        self.root.config(menu=menubar)
-        
-        # Settings menu
-        settings_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Settings", menu=settings_menu)
-        settings_menu.add_command(label="Hugging Face Authentication", command=self.open_hf_settings)
-        
-        # Main container with padding
-        main_container = tk.Frame(self.root, bg=colors['background'])
-        main_container.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
-        # Header section
-        header_frame = tk.Frame(main_container, bg=colors['background'])
-        header_frame.pack(fill=tk.X, pady=(0, 30))
-        
-        # Title
-        title_label = tk.Label(header_frame, text="AudioTranscriber", 
-                             font=('Segoe UI', 28, 'bold'), 
-                             fg=colors['primary'], bg=colors['background'])
-        title_label.pack()
-        
-        # Subtitle
-        subtitle_label = tk.Label(header_frame, text="Transform audio into text with AI-powered transcription", 
-                                 font=('Segoe UI', 14), 
-                                 fg=colors['text_light'], bg=colors['background'])
-        subtitle_label.pack(pady=(5, 0))
+        # Progress bar
+        style.configure('White.Horizontal.TProgressbar',
+                       background=COLORS['primary'],
+                       troughcolor=COLORS['border'],
+                       borderwidth=0,
+                       thickness=8)
         
-        # Create main workflow cards
-        self.create_workflow_cards(main_container, colors)
+        AudioTranscriberGUI._styles_done = True
     
-    def create_workflow_cards(self, parent, colors):
+    def create_workflow_cards(self, parent):
         """Create modern workflow cards for the UI"""
         
         # Step 1: Audio Input Card
-        self.create_audio_input_card(parent, colors)
+        self.create_audio_input_card(parent)
         
+        # Steps 2 and 3 are built once the window has painted the first card
+        self.root.after(50, self._build_rest, parent)
+    
+    def _build_rest(self, parent):
+        """Build the settings and results cards"""
         # Step 2: Transcription Settings Card  
-        self.create_settings_card(parent, colors)
+        self.create_settings_card(parent)
         
         # Step 3: Results Card
-        self.create_results_card(parent, colors)
+        self.create_results_card(parent)
     
-    def create_audio_input_card(self, parent, colors):
+    def create_audio_input_card(self, parent):
         """Create the audio input card"""
         # Card container
-        card_frame = tk.Frame(parent, bg=colors['surface'], relief='flat', bd=0)
+        card_frame = tk.Frame(parent, bg=COLORS['surface'], relief='flat', bd=0)
         card_frame.pack(fill=tk.X, pady=(0, 20))
         
         # Add subtle shadow effect with border
-        shadow_frame = tk.Frame(parent, bg=colors['border'], height=2)
+        shadow_frame = tk.Frame(parent, bg=COLORS['border'], height=2)
         shadow_frame.pack(fill=tk.X, pady=(0, 18))
         
         # Card content
-        content_frame = tk.Frame(card_frame, bg=colors['surface'])
+        content_frame = tk.Frame(card_frame, bg=COLORS['surface'])
         content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # Card title
-        title_frame = tk.Frame(content_frame, bg=colors['surface'])
+        title_frame = tk.Frame(content_frame, bg=COLORS['surface'])
         title_frame.pack(fill=tk.X, pady=(0, 20))
         
         tk.Label(title_frame, text="🎤 Audio Input", 
                 font=('Segoe UI', 16, 'bold'), 
-                fg=colors['text'], bg=colors['surface']).pack(side=tk.LEFT)
+                fg=COLORS['text'], bg=COLORS['surface']).pack(side=tk.LEFT)
         
         # Input options
-        input_frame = tk.Frame(content_frame, bg=colors['surface'])
+        input_frame = tk.Frame(content_frame, bg=COLORS['surface'])
         input_frame.pack(fill=tk.X, pady=(0, 15))
         
         # Option 1: Record Audio
-        record_frame = tk.Frame(input_frame, bg=colors['surface'])
+        record_frame = tk.Frame(input_frame, bg=COLORS['surface'])
         record_frame.pack(fill=tk.X, pady=(0, 15))
         
         tk.Label(record_frame, text="Record new audio:", 
                 font=('Segoe UI', 12, 'bold'), 
-                fg=colors['text'], bg=colors['surface']).pack(anchor=tk.W)
+                fg=COLORS['text'], bg=COLORS['surface']).pack(anchor=tk.W)
         
-        record_controls = tk.Frame(record_frame, bg=colors['surface'])
+        record_controls = tk.Frame(record_frame, bg=COLORS['surface'])
         record_controls.pack(fill=tk.X, pady=(10, 0))
         
         if AUDIO_RECORDING_AVAILABLE:
             # Format selection
-            format_frame = tk.Frame(record_controls, bg=colors['surface'])
+            format_frame = tk.Frame(record_controls, bg=COLORS['surface'])
             format_frame.pack(side=tk.LEFT, padx=(0, 20))
             
             tk.Label(format_frame, text="Format:", 
                     font=('Segoe UI', 10), 
-                    fg=colors['text'], bg=colors['surface']).pack(side=tk.LEFT, padx=(0, 8))
+                    fg=COLORS['text'], bg=COLORS['surface']).pack(side=tk.LEFT, padx=(0, 8))
             
             format_options = ["WAV", "MP3"]
             format_var = tk.StringVar(value=self.recording_format.get().upper())
             format_dropdown = tk.OptionMenu(format_frame, format_var, *format_options, 
                                           command=lambda x: self.recording_format.set(x.lower()))
-            format_dropdown.config(bg=colors['surface'], fg=colors['text'], 
-                                 activebackground=colors['primary'], activeforeground='white',
+            format_dropdown.config(bg=COLORS['surface'], fg=COLORS['text'], 
+                                 activebackground=COLORS['primary'], activeforeground='white',
                                  relief='solid', bd=1, width=8)
             format_dropdown.pack(side=tk.LEFT)
             
             # Recording buttons
-            button_frame = tk.Frame(record_controls, bg=colors['surface'])
+            button_frame = tk.Frame(record_controls, bg=COLORS['surface'])
             button_frame.pack(side=tk.LEFT, padx=(0, 20))
             
             self.record_button = ttk.Button(button_frame, text="🎤 Start Recording", 
@@ -273,148 +519,152 @@ class AudioTranscriberGUI:
                                                  command=self.stop_recording, state="disabled", style='Accent.TButton')
             self.stop_record_button.pack(side=tk.LEFT)
             
+            self.view_recordings_button = ttk.Button(button_frame, text="📁 View Recordings", 
+                                                     command=self.view_recordings, style='Warning.TButton')
+            self.view_recordings_button.pack(side=tk.LEFT, padx=(10, 0))
+            
             # Status
             self.record_status_label = tk.Label(record_controls, text="Ready to record", 
                                                font=('Segoe UI', 10), 
-                                               fg=colors['text_light'], bg=colors['surface'])
+                                               fg=COLORS['text_light'], bg=COLORS['surface'])
             self.record_status_label.pack(side=tk.LEFT, padx=(20, 0))
             
             # Audio level meter
-            level_frame = tk.Frame(record_controls, bg=colors['surface'])
+            level_frame = tk.Frame(record_controls, bg=COLORS['surface'])
             level_frame.pack(side=tk.RIGHT)
             
             tk.Label(level_frame, text="Level:", 
                     font=('Segoe UI', 9), 
-                    fg=colors['text_light'], bg=colors['surface']).pack(side=tk.LEFT, padx=(0, 5))
+                    fg=COLORS['text_light'], bg=COLORS['surface']).pack(side=tk.LEFT, padx=(0, 5))
             
             self.audio_level_canvas = tk.Canvas(level_frame, width=80, height=16, 
-                                               bg=colors['surface'], highlightthickness=0)
+                                               bg=COLORS['surface'], highlightthickness=0)
             self.audio_level_canvas.pack(side=tk.LEFT, padx=(0, 5))
             
             # Draw the progress bar background
-            self.audio_level_canvas.create_rectangle(0, 0, 80, 16, fill=colors['surface'], outline=colors['border'])
-            self.audio_level_progress = self.audio_level_canvas.create_rectangle(0, 0, 0, 16, fill=colors['primary'], outline="")
+            self.audio_level_canvas.create_rectangle(0, 0, 80, 16, fill=COLORS['surface'], outline=COLORS['border'])
+            self.audio_level_progress = self.audio_level_canvas.create_rectangle(0, 0, 0, 16, fill=COLORS['primary'], outline="")
             
             self.audio_level_label = tk.Label(level_frame, text="0%", 
                                              font=('Segoe UI', 9), 
-                                             fg=colors['text_light'], bg=colors['surface'])
+                                             fg=COLORS['text_light'], bg=COLORS['surface'])
             self.audio_level_label.pack(side=tk.LEFT)
         else:
             tk.Label(record_frame, text="Audio recording not available. Install PyAudio to enable recording.", 
                     font=('Segoe UI', 10), 
-                    fg=colors['accent'], bg=colors['surface']).pack(anchor=tk.W, pady=(10, 0))
+                    fg=COLORS['accent'], bg=COLORS['surface']).pack(anchor=tk.W, pady=(10, 0))
         
         # Option 2: Upload File
-        upload_frame = tk.Frame(input_frame, bg=colors['surface'])
+        upload_frame = tk.Frame(input_frame, bg=COLORS['surface'])
         upload_frame.pack(fill=tk.X)
         
         tk.Label(upload_frame, text="Or upload audio file:", 
                 font=('Segoe UI', 12, 'bold'), 
-                fg=colors['text'], bg=colors['surface']).pack(anchor=tk.W)
+                fg=COLORS['text'], bg=COLORS['surface']).pack(anchor=tk.W)
         
-        file_frame = tk.Frame(upload_frame, bg=colors['surface'])
+        file_frame = tk.Frame(upload_frame, bg=COLORS['surface'])
         file_frame.pack(fill=tk.X, pady=(10, 0))
         
         self.audio_file_entry = tk.Entry(file_frame, textvariable=self.audio_file_path, state="readonly", 
-                                       bg=colors['surface'], fg=colors['text'], 
+                                       bg=COLORS['surface'], fg=COLORS['text'], 
                                        font=('Segoe UI', 10), relief='solid', bd=1)
         self.audio_file_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
         
         ttk.Button(file_frame, text="📁 Browse", command=self.browse_file, style='Warning.TButton').pack(side=tk.LEFT, padx=(0, 8))
         ttk.Button(file_frame, text="🗑️ Clear", command=self.clear_audio_file, style='Accent.TButton').pack(side=tk.LEFT)
     
-    def create_settings_card(self, parent, colors):
+    def create_settings_card(self, parent):
         """Create the transcription settings card"""
         # Card container
-        card_frame = tk.Frame(parent, bg=colors['surface'], relief='flat', bd=0)
+        card_frame = tk.Frame(parent, bg=COLORS['surface'], relief='flat', bd=0)
         card_frame.pack(fill=tk.X, pady=(0, 20))
         
         # Add subtle shadow effect with border
-        shadow_frame = tk.Frame(parent, bg=colors['border'], height=2)
+        shadow_frame = tk.Frame(parent, bg=COLORS['border'], height=2)
         shadow_frame.pack(fill=tk.X, pady=(0, 18))
         
         # Card content
-        content_frame = tk.Frame(card_frame, bg=colors['surface'])
+        content_frame = tk.Frame(card_frame, bg=COLORS['surface'])
         content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # Card title
-        title_frame = tk.Frame(content_frame, bg=colors['surface'])
+        title_frame = tk.Frame(content_frame, bg=COLORS['surface'])
         title_frame.pack(fill=tk.X, pady=(0, 20))
         
         tk.Label(title_frame, text="⚙️ Transcription Settings", 
                 font=('Segoe UI', 16, 'bold'), 
-                fg=colors['text'], bg=colors['surface']).pack(side=tk.LEFT)
+                fg=COLORS['text'], bg=COLORS['surface']).pack(side=tk.LEFT)
         
         # Settings grid
-        settings_frame = tk.Frame(content_frame, bg=colors['surface'])
+        settings_frame = tk.Frame(content_frame, bg=COLORS['surface'])
         settings_frame.pack(fill=tk.X)
         
         # Row 1: Model and Language
-        row1 = tk.Frame(settings_frame, bg=colors['surface'])
+        row1 = tk.Frame(settings_frame, bg=COLORS['surface'])
         row1.pack(fill=tk.X, pady=(0, 15))
         
         # Model selection
-        model_frame = tk.Frame(row1, bg=colors['surface'])
+        model_frame = tk.Frame(row1, bg=COLORS['surface'])
         model_frame.pack(side=tk.LEFT, padx=(0, 30))
         
         tk.Label(model_frame, text="Model:", 
                 font=('Segoe UI', 11, 'bold'), 
-                fg=colors['text'], bg=colors['surface']).pack(anchor=tk.W)
+                fg=COLORS['text'], bg=COLORS['surface']).pack(anchor=tk.W)
         
-        model_options = ["Tiny (Fastest)", "Base (Balanced)", "Small (Better)", "Medium (Good)", "Large (Best)"]
-        model_var = tk.StringVar(value="Base (Balanced)")
-        model_dropdown = tk.OptionMenu(model_frame, model_var, *model_options)
-        model_dropdown.config(bg=colors['surface'], fg=colors['text'], 
-                             activebackground=colors['primary'], activeforeground='white',
-                             relief='solid', bd=1, width=15)
-        model_dropdown.pack(anchor=tk.W, pady=(5, 0))
+        self.model_combo = ttk.Combobox(model_frame, textvariable=self.selected_model,
+                                        values=MODEL_DISPLAY, state="readonly", width=20)
+        self.model_combo.pack(anchor=tk.W, pady=(5, 0))
         
         # Language selection
-        lang_frame = tk.Frame(row1, bg=colors['surface'])
+        lang_frame = tk.Frame(row1, bg=COLORS['surface'])
         lang_frame.pack(side=tk.LEFT, padx=(0, 30))
         
         tk.Label(lang_frame, text="Language:", 
                 font=('Segoe UI', 11, 'bold'), 
-                fg=colors['text'], bg=colors['surface']).pack(anchor=tk.W)
+                fg=COLORS['text'], bg=COLORS['surface']).pack(anchor=tk.W)
+        
+        self.language_combo = ttk.Combobox(lang_frame, textvariable=self.selected_language,
+                                           values=LANG_DISPLAY, state="readonly", width=12)
+        self.language_combo.pack(anchor=tk.W, pady=(5, 0))
+        
+        # Task selection
+        task_frame = tk.Frame(row1, bg=COLORS['surface'])
+        task_frame.pack(side=tk.LEFT, padx=(0, 30))
+        
+        tk.Label(task_frame, text="Task:", 
+                font=('Segoe UI', 11, 'bold'), 
+                fg=COLORS['text'], bg=COLORS['surface']).pack(anchor=tk.W)
         
-        lang_options = ["Auto-detect", "English", "Spanish", "French", "German", "Italian", "Portuguese", "Chinese", "Japanese"]
-        lang_var = tk.StringVar(value="Auto-detect")
-        lang_dropdown = tk.OptionMenu(lang_frame, lang_var, *lang_options)
-        lang_dropdown.config(bg=colors['surface'], fg=colors['text'], 
-                            activebackground=colors['primary'], activeforeground='white',
-                            relief='solid', bd=1, width=12)
-        lang_dropdown.pack(anchor=tk.W, pady=(5, 0))
+        self.task_combo = ttk.Combobox(task_frame, textvariable=self.selected_task,
+                                       values=TASK_DISPLAY, state="readonly", width=18)
+        self.task_combo.pack(anchor=tk.W, pady=(5, 0))
         
         # Output format
-        output_frame = tk.Frame(row1, bg=colors['surface'])
+        output_frame = tk.Frame(row1, bg=COLORS['surface'])
         output_frame.pack(side=tk.LEFT)
         
         tk.Label(output_frame, text="Output:", 
                 font=('Segoe UI', 11, 'bold'), 
-                fg=colors['text'], bg=colors['surface']).pack(anchor=tk.W)
+                fg=COLORS['text'], bg=COLORS['surface']).pack(anchor=tk.W)
         
-        output_options = ["Plain Text", "SRT Subtitles", "WebVTT Subtitles"]
-        output_var = tk.StringVar(value="Plain Text")
-        output_dropdown = tk.OptionMenu(output_frame, output_var, *output_options)
-        output_dropdown.config(bg=colors['surface'], fg=colors['text'], 
-                              activebackground=colors['primary'], activeforeground='white',
-                              relief='solid', bd=1, width=12)
-        output_dropdown.pack(anchor=tk.W, pady=(5, 0))
+        self.output_combo = ttk.Combobox(output_frame, textvariable=self.selected_output,
+                                         values=OUTPUT_DISPLAY, state="readonly", width=18)
+        self.output_combo.pack(anchor=tk.W, pady=(5, 0))
         
         # Row 2: Advanced options
-        row2 = tk.Frame(settings_frame, bg=colors['surface'])
+        row2 = tk.Frame(settings_frame, bg=COLORS['surface'])
         row2.pack(fill=tk.X, pady=(15, 0))
         
         # Speaker detection
-        speaker_frame = tk.Frame(row2, bg=colors['surface'])
+        speaker_frame = tk.Frame(row2, bg=COLORS['surface'])
         speaker_frame.pack(side=tk.LEFT, padx=(0, 30))
         
         self.speaker_checkbox = tk.Checkbutton(speaker_frame, text="Detect different speakers", 
                                               variable=self.detect_speakers,
                                               font=('Segoe UI', 10),
-                                              fg=colors['text'], bg=colors['surface'],
-                                              activebackground=colors['surface'],
-                                              selectcolor=colors['primary'])
+                                              fg=COLORS['text'], bg=COLORS['surface'],
+                                              activebackground=COLORS['surface'],
+                                              selectcolor=COLORS['primary'])
         self.speaker_checkbox.pack(anchor=tk.W)
         
         # View transcriptions button
@@ -422,7 +672,7 @@ class AudioTranscriberGUI:
                   command=self.view_transcriptions, style='Warning.TButton').pack(side=tk.LEFT, padx=(20, 0))
         
         # Main action button
-        action_frame = tk.Frame(content_frame, bg=colors['surface'])
+        action_frame = tk.Frame(content_frame, bg=COLORS['surface'])
         action_frame.pack(fill=tk.X, pady=(20, 0))
         
         self.transcribe_button = ttk.Button(action_frame, text="🚀 Start Transcription", 
@@ -433,253 +683,60 @@ class AudioTranscriberGUI:
                                       command=self.clear_all, style='Accent.TButton')
         self.clear_button.pack(side=tk.LEFT, padx=(15, 0))
     
-    def create_results_card(self, parent, colors):
+    def create_results_card(self, parent):
         """Create the results card"""
         # Card container
-        card_frame = tk.Frame(parent, bg=colors['surface'], relief='flat', bd=0)
+        card_frame = tk.Frame(parent, bg=COLORS['surface'], relief='flat', bd=0)
         card_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
         
         # Add subtle shadow effect with border
-        shadow_frame = tk.Frame(parent, bg=colors['border'], height=2)
+        shadow_frame = tk.Frame(parent, bg=COLORS['border'], height=2)
         shadow_frame.pack(fill=tk.X, pady=(0, 18))
         
         # Card content
-        content_frame = tk.Frame(card_frame, bg=colors['surface'])
+        content_frame = tk.Frame(card_frame, bg=COLORS['surface'])
         content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # Card title
-        title_frame = tk.Frame(content_frame, bg=colors['surface'])
+        title_frame = tk.Frame(content_frame, bg=COLORS['surface'])
         title_frame.pack(fill=tk.X, pady=(0, 15))
         
         tk.Label(title_frame, text="📝 Transcription Results", 
                 font=('Segoe UI', 16, 'bold'), 
-                fg=colors['text'], bg=colors['surface']).pack(side=tk.LEFT)
+                fg=COLORS['text'], bg=COLORS['surface']).pack(side=tk.LEFT)
         
         # Progress bar
-        progress_frame = tk.Frame(content_frame, bg=colors['surface'])
+        progress_frame = tk.Frame(content_frame, bg=COLORS['surface'])
         progress_frame.pack(fill=tk.X, pady=(0, 10))
         
         self.progress_var = tk.DoubleVar()
-        
-        # Create modern progress bar using Canvas
-        self.progress_canvas = tk.Canvas(progress_frame, width=400, height=8, 
-                                        bg=colors['surface'], highlightthickness=0)
-        self.progress_canvas.pack(fill=tk.X)
-        
-        # Draw the progress bar background
-        self.progress_canvas.create_rectangle(0, 0, 400, 8, fill=colors['border'], outline="")
-        self.progress_fill = self.progress_canvas.create_rectangle(0, 0, 0, 8, fill=colors['primary'], outline="")
+        self.progress_bar = ttk.Progressbar(progress_frame, length=400, mode='determinate',
+                                            variable=self.progress_var,
+                                            style='White.Horizontal.TProgressbar')
+        self.progress_bar.pack(fill=tk.X)
         
         # Status label
         self.status_label = tk.Label(content_frame, text="Ready to transcribe", 
                                     font=('Segoe UI', 11), 
-                                    fg=colors['text_light'], bg=colors['surface'])
+                                    fg=COLORS['text_light'], bg=COLORS['surface'])
         self.status_label.pack(anchor=tk.W, pady=(0, 15))
         
         # Results text area
         self.results_text = scrolledtext.ScrolledText(content_frame, height=12, width=80,
                                                      font=('Segoe UI', 10),
-                                                     bg=colors['surface'], fg=colors['text'],
+                                                     bg=COLORS['surface'], fg=COLORS['text'],
                                                      relief='solid', bd=1,
                                                      wrap=tk.WORD)
         self.results_text.pack(fill=tk.BOTH, expand=True)
         
+        # Shown only while part of a long transcript is still hidden
+        self.load_more_button = ttk.Button(content_frame, text="Load more", 
+                                          command=self.load_more_results)
+        
         # Configure grid weights for resizing
         parent.columnconfigure(0, weight=1)
         parent.rowconfigure(0, weight=1)
     
-    def update_status(self, message):
-            format_options = ["wav", "mp3"]
-            format_var = tk.StringVar(value=self.recording_format.get())
-            format_dropdown = tk.OptionMenu(recording_frame, format_var, *format_options, 
-                                          command=lambda x: self.recording_format.set(x))
-            format_dropdown.config(bg=colors['background'], fg=colors['text'], 
-                                 activebackground=colors['primary'], activeforeground='white',
-                                 relief='solid', bd=1, width=8)
-            format_dropdown.grid(row=1, column=1, padx=(0, 10), pady=5)
-            
-            # Recording controls
-            self.record_button = ttk.Button(recording_frame, text="🎤 Start Recording", 
-                                           command=self.start_recording, style='Success.TButton')
-            self.record_button.grid(row=1, column=2, padx=(10, 15), pady=5)
-            
-            self.stop_record_button = ttk.Button(recording_frame, text="⏹️ Stop Recording", 
-                                                 command=self.stop_recording, state="disabled", style='Accent.TButton')
-            self.stop_record_button.grid(row=1, column=3, padx=(0, 15), pady=5)
-            
-            self.record_status_label = tk.Label(recording_frame, text="Ready to record", 
-                                               font=("Arial", 9), fg=colors['text'], bg=colors['background'])
-            self.record_status_label.grid(row=1, column=4, sticky=tk.W, padx=(10, 15), pady=5)
-            
-            # Audio level meter
-            self.audio_level_frame = tk.Frame(recording_frame, bg=colors['background'])
-            self.audio_level_frame.grid(row=1, column=5, sticky=tk.W, padx=(10, 15), pady=5)
-            
-            tk.Label(self.audio_level_frame, text="Level:", font=("Arial", 8), fg=colors['text'], bg=colors['background']).pack(side=tk.LEFT)
-            
-            # Create white progress bar using Canvas
-            self.audio_level_canvas = tk.Canvas(self.audio_level_frame, width=100, height=20, 
-                                               bg=colors['background'], highlightthickness=0)
-            self.audio_level_canvas.pack(side=tk.LEFT, padx=(5, 0))
-            
-            # Draw the progress bar background
-            self.audio_level_canvas.create_rectangle(0, 0, 100, 20, fill=colors['background'], outline=colors['border'])
-            self.audio_level_progress = self.audio_level_canvas.create_rectangle(0, 0, 0, 20, fill=colors['primary'], outline="")
-            
-            self.audio_level_label = tk.Label(self.audio_level_frame, text="0%", font=("Arial", 8), fg=colors['text'], bg=colors['background'])
-            self.audio_level_label.pack(side=tk.LEFT, padx=(5, 0))
-            
-            # View recordings button only
-            view_frame = tk.Frame(recording_frame, bg=colors['background'])
-            view_frame.grid(row=2, column=0, columnspan=5, sticky=(tk.W, tk.E), pady=(5, 10), padx=15)
-            
-            self.view_recordings_button = ttk.Button(view_frame, text="📁 View Recordings", 
-                                                   command=self.view_recordings, style='Warning.TButton')
-            self.view_recordings_button.pack(side=tk.LEFT, padx=(0, 8))
-            
-            # Recording info
-            recording_info_text = "Record audio directly from your microphone for transcription"
-            tk.Label(recording_frame, text=recording_info_text, font=("Arial", 8), 
-                     fg=colors['text_light'], bg=colors['background']).grid(row=3, column=0, columnspan=5, sticky=tk.W, pady=(0, 10), padx=15)
-        else:
-            # Show message when recording is not available
-            self.record_button = None
-            self.stop_record_button = None
-            self.record_status_label = None
-            
-            no_recording_text = "Audio recording not available. Install PyAudio to enable recording."
-            tk.Label(recording_frame, text=no_recording_text, font=("Arial", 9), 
-                     fg="red", bg=colors['background']).grid(row=1, column=0, columnspan=3, sticky=tk.W, pady=5, padx=15)
-            
-            install_text = "To install PyAudio: pip install pyaudio"
-            tk.Label(recording_frame, text=install_text, font=("Arial", 8), 
-                     fg=colors['text_light'], bg=colors['background']).grid(row=2, column=0, columnspan=3, sticky=tk.W, pady=(0, 10), padx=15)
-        
-        # Transcription Settings section
-        settings_frame = tk.Frame(main_frame, bg=colors['background'], relief='solid', bd=1)
-        settings_frame.grid(row=3, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=10, padx=5)
-        settings_frame.columnconfigure(1, weight=1)
-        
-        # Add title label for the settings frame
-        settings_title = tk.Label(settings_frame, text="⚙️ Transcription Settings", 
-                                 font=('Segoe UI', 11, 'bold'), 
-                                 fg=colors['text'], bg=colors['background'])
-        settings_title.grid(row=0, column=0, columnspan=3, sticky=tk.W, pady=(10, 15), padx=15)
-        
-        # File selection
-        tk.Label(settings_frame, text="Audio File:", font=("Arial", 10, "bold"), fg=colors['text'], bg=colors['background']).grid(row=1, column=0, sticky=tk.W, pady=(0, 5), padx=15)
-        file_frame = tk.Frame(settings_frame, bg=colors['background'])
-        file_frame.grid(row=1, column=1, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 5), padx=(0, 15))
-        file_frame.columnconfigure(0, weight=1)
-        
-        self.audio_file_entry = tk.Entry(file_frame, textvariable=self.audio_file_path, state="readonly", 
-                                       bg=colors['background'], fg=colors['text'], relief='solid', bd=1)
-        self.audio_file_entry.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=(0, 8))
-        
-        ttk.Button(file_frame, text="📂 Browse", command=self.browse_file, style='Warning.TButton').grid(row=0, column=1, padx=(0, 8))
-        ttk.Button(file_frame, text="🗑️ Clear", command=self.clear_audio_file, style='Accent.TButton').grid(row=0, column=2)
-        
-        # Model selection
-        ttk.Label(settings_frame, text="Model:", font=("Arial", 10, "bold")).grid(row=1, column=0, sticky=tk.W, pady=(10, 5))
-        model_frame = ttk.Frame(settings_frame)
-        model_frame.grid(row=1, column=1, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 5))
-        model_frame.columnconfigure(0, weight=1)
-        
-        self.model_combo = ttk.Combobox(model_frame, textvariable=self.selected_model, 
-                                       values=[model[0] for model in self.models], 
-                                       state="readonly", width=45)
-        self.model_combo.grid(row=0, column=0, sticky=(tk.W, tk.E))
-        self.model_combo.set("Base (Balanced, ~1GB VRAM)")
-        
-        # Language selection
-        ttk.Label(settings_frame, text="Language:", font=("Arial", 10, "bold")).grid(row=2, column=0, sticky=tk.W, pady=(10, 5))
-        lang_frame = ttk.Frame(settings_frame)
-        lang_frame.grid(row=2, column=1, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 5))
-        lang_frame.columnconfigure(0, weight=1)
-        
-        self.language_combo = ttk.Combobox(lang_frame, textvariable=self.selected_language,
-                                         values=[lang[0] for lang in self.languages],
-                                         state="readonly", width=45)
-        self.language_combo.grid(row=0, column=0, sticky=(tk.W, tk.E))
-        self.language_combo.set("Auto-detect")
-        
-        # Task selection
-        ttk.Label(settings_frame, text="Task:", font=("Arial", 10, "bold")).grid(row=3, column=0, sticky=tk.W, pady=(10, 5))
-        task_frame = ttk.Frame(settings_frame)
-        task_frame.grid(row=3, column=1, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 5))
-        task_frame.columnconfigure(0, weight=1)
-        
-        self.task_combo = ttk.Combobox(task_frame, textvariable=self.selected_task,
-                                      values=[task[0] for task in self.tasks],
-                                      state="readonly", width=45)
-        self.task_combo.grid(row=0, column=0, sticky=(tk.W, tk.E))
-        self.task_combo.set("transcribe")
-        
-        # Output format
-        ttk.Label(settings_frame, text="Output Format:", font=("Arial", 10, "bold")).grid(row=4, column=0, sticky=tk.W, pady=(10, 5))
-        output_frame = ttk.Frame(settings_frame)
-        output_frame.grid(row=4, column=1, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 5))
-        output_frame.columnconfigure(0, weight=1)
-        
-        self.output_combo = ttk.Combobox(output_frame, textvariable=self.selected_output,
-                                        values=[fmt[0] for fmt in self.output_formats],
-                                        state="readonly", width=45)
-        self.output_combo.grid(row=0, column=0, sticky=(tk.W, tk.E))
-        self.output_combo.set("Plain Text (.txt)")
-        
-        # Speaker detection checkbox
-        speaker_frame = ttk.Frame(settings_frame)
-        speaker_frame.grid(row=5, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(15, 5))
-        
-        self.speaker_checkbox = ttk.Checkbutton(speaker_frame, text="Detect different speakers", 
-                                              variable=self.detect_speakers)
-        self.speaker_checkbox.grid(row=0, column=0, sticky=tk.W)
-        
-        # View transcriptions button
-        self.view_transcriptions_button = ttk.Button(speaker_frame, text="📄 View Transcriptions", 
-                                                    command=self.view_transcriptions, style='Warning.TButton')
-        self.view_transcriptions_button.grid(row=0, column=1, sticky=tk.W, padx=(20, 0))
-        
-        # Control buttons (moved to bottom)
-        button_frame = ttk.Frame(main_frame)
-        button_frame.grid(row=4, column=0, columnspan=3, pady=20)
-        
-        self.transcribe_button = ttk.Button(button_frame, text="🚀 Start Transcription", 
-                                           command=self.start_transcription, style='Primary.TButton')
-        self.transcribe_button.pack(side=tk.LEFT, padx=(0, 20))
-        
-        self.clear_button = ttk.Button(button_frame, text="🧹 Clear", 
-                                      command=self.clear_all, style='Accent.TButton')
-        self.clear_button.pack(side=tk.LEFT, padx=(0, 0))
-        
-        # Progress bar
-        self.progress_var = tk.DoubleVar()
-        
-        # Create white progress bar using Canvas
-        self.progress_canvas = tk.Canvas(main_frame, width=400, height=25, 
-                                        bg=colors['background'], highlightthickness=0)
-        self.progress_canvas.grid(row=5, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=10)
-        
-        # Draw the progress bar background
-        self.progress_canvas.create_rectangle(0, 0, 400, 25, fill=colors['background'], outline=colors['border'])
-        self.progress_fill = self.progress_canvas.create_rectangle(0, 0, 0, 25, fill=colors['primary'], outline="")
-        
-        # Status label
-        self.status_label = ttk.Label(main_frame, text="Ready to transcribe", 
-                                    font=("Segoe UI", 10, "bold"))
-        self.status_label.grid(row=6, column=0, columnspan=3, pady=5)
-        
-        # Results area
-        ttk.Label(main_frame, text="📝 Transcription Results:", 
-                font=("Segoe UI", 12, "bold")).grid(row=7, column=0, columnspan=3, 
-                                                sticky=tk.W, pady=(20, 5))
-        
-        self.results_text = scrolledtext.ScrolledText(main_frame, height=8, width=80)
-        self.results_text.grid(row=8, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
-        
-        # Configure grid weights for resizing
-        main_frame.rowconfigure(8, weight=1)
-        
     def open_hf_settings(self):
         """Open Hugging Face settings window"""
         settings_window = tk.Toplevel(self.root)
@@ -712,8 +769,11 @@ class AudioTranscriberGUI:
         
         ttk.Label(token_frame, text="HF Token:").pack(side=tk.LEFT, padx=(0, 10))
         
-        token_entry = ttk.Entry(token_frame, textvariable=self.hf_token, show="*", width=40)
+        # Read on Save instead of binding a StringVar that updates on every keystroke
+        token_entry = ttk.Entry(token_frame, show="*", width=40)
+        token_entry.insert(0, self.hf_token)
         token_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
+        self._token_entry = token_entry
         
         # Buttons frame
         buttons_frame = ttk.Frame(main_frame)
@@ -733,18 +793,9 @@ class AudioTranscriberGUI:
     
     def browse_file(self):
         """Open file dialog to select audio file"""
-        filetypes = [
-            ("Audio files", "*.mp3 *.wav *.flac *.m4a *.mp4 *.avi *.mov *.mkv"),
-            ("MP3 files", "*.mp3"),
-            ("WAV files", "*.wav"),
-            ("FLAC files", "*.flac"),
-            ("M4A files", "*.m4a"),
-            ("All files", "*.*")
-        ]
-        
         filename = filedialog.askopenfilename(
             title="Select Audio File",
-            filetypes=filetypes
+            filetypes=self._FILETYPES
         )
         
         if filename:
@@ -758,7 +809,7 @@ class AudioTranscriberGUI:
     
     def save_hf_token(self):
         """Save Hugging Face token"""
-        token = self.hf_token.get().strip()
+        token = self._token_entry.get().strip()
         if not token:
             messagebox.showwarning("Warning", "Please enter a Hugging Face token!")
             return
@@ -768,6 +819,7 @@ class AudioTranscriberGUI:
             hf_auth = HuggingFaceAuth()
             if hf_auth.save_token(token):
                 if hf_auth.authenticate(token):
+                    self.hf_token = token
                     messagebox.showinfo("Success", "Hugging Face token saved and authenticated successfully!")
                     self.update_status("HF token authenticated")
                 else:
@@ -783,7 +835,8 @@ class AudioTranscriberGUI:
             from speaker_diarization import HuggingFaceAuth
             hf_auth = HuggingFaceAuth()
             if hf_auth.clear_token():
-                self.hf_token.set("")
+                self.hf_token = ""
+                self._token_entry.delete(0, tk.END)
                 messagebox.showinfo("Success", "Hugging Face token cleared!")
                 self.update_status("HF token cleared")
             else:
@@ -792,20 +845,37 @@ class AudioTranscriberGUI:
             messagebox.showerror("Error", f"Error clearing token: {str(e)}")
     
     def update_audio_level(self, level):
-        """Update the audio level display"""
-        if hasattr(self, 'audio_level_bar') and hasattr(self, 'audio_level_label'):
-            self.root.after(0, self._update_audio_level_ui, level)
+        """Update the audio level display (throttled to ~15 Hz)"""
+        now = time.monotonic()
+        if now - self._level_last_ts < 0.066:
+            return
+        self._level_last_ts = now
+        self._ui_queue.put_nowait(("level", level))
+    
+    def _drain_ui(self):
+        """Apply queued recorder updates on the Tk thread, once per ~30 fps frame"""
+        while True:
+            try:
+                kind, data = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._ui_handlers[kind](data)
+        self.root.after(33, self._drain_ui)
+    
+    def _device_detected(self, device):
+        """Show the compute device picked by _warm_model"""
+        self.device_label.config(text=f"Device: {device}")
     
     def _update_audio_level_ui(self, level):
         """Update audio level UI elements (called from main thread)"""
-        try:
-            if hasattr(self, 'audio_level_canvas') and hasattr(self, 'audio_level_progress'):
-                # Update canvas-based progress bar
-                width = int((level / 100.0) * 100)
-                self.audio_level_canvas.coords(self.audio_level_progress, 0, 0, width, 20)
-            self.audio_level_label.config(text=f"{level:.1f}%")
-        except:
-            pass  # Ignore errors if widgets don't exist yet
+        px = int(80 * level / 100.0)
+        canvas = self.audio_level_canvas
+        if canvas is not None and px != self._last_level_px:
+            canvas.coords(self.audio_level_progress, 0, 0, px, 16)
+            self._last_level_px = px
+        label = self.audio_level_label
+        if label is not None:
+            label.config(text=f"{level:.1f}%")
     
     def start_recording(self):
         """Start recording audio from microphone"""
@@ -826,6 +896,7 @@ class AudioTranscriberGUI:
             # Start recording with selected format
             recording_format = self.recording_format.get()
             self.recording_file = self.audio_recorder.start_recording(format=recording_format)
+            self.recorded_audio = None
             
             if self.recording_file:
                 self.is_recording = True
@@ -854,90 +925,78 @@ class AudioTranscriberGUI:
             return
         
         try:
-            # Stop recording
-            saved_file = self.audio_recorder.stop_recording()
+            # Stop capturing; the waveform stays in memory for transcription
+            self.recorded_audio = self.audio_recorder.stop_capture()
+            self.is_recording = False
+            self.record_button.config(state="normal")
+            self.stop_record_button.config(state="disabled")
             
-            if saved_file:
-                self.is_recording = False
-                self.record_button.config(state="normal")
-                self.stop_record_button.config(state="disabled")
-                self.record_status_label.config(text="Recording saved")
-                self.update_status("Recording completed")
-                
-                # Reset audio level display
-                if hasattr(self, 'audio_level_canvas') and hasattr(self, 'audio_level_progress'):
-                    self.audio_level_canvas.coords(self.audio_level_progress, 0, 0, 0, 20)
-                if hasattr(self, 'audio_level_label'):
-                    self.audio_level_label.config(text="0%")
-                
-                # Update the file path to the saved recording
-                self.audio_file_path.set(saved_file)
-                
-                messagebox.showinfo("Recording Complete", 
-                                  f"Recording saved successfully!\n\nFile: {os.path.basename(saved_file)}\n\nYou can now transcribe this recording.")
-            else:
+            # Reset audio level display
+            self._update_audio_level_ui(0)
+            
+            if self.recorded_audio is None:
                 messagebox.showerror("Error", "Failed to save recording.")
                 self.record_status_label.config(text="Recording failed")
+                return
+            
+            self.record_status_label.config(text="Saving recording...")
+            self.update_status("Recording completed")
+            
+            # Write the file in the background; transcription does not need to wait for it
+            threading.Thread(target=self._save_recording, daemon=True).start()
                 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to stop recording: {str(e)}")
             self.record_status_label.config(text="Recording error")
     
+    def _save_recording(self):
+        """Write the captured recording to disk (runs on a worker thread)"""
+        saved_file = self.audio_recorder.save_recording()
+        self._ui_queue.put_nowait(("recording_saved", saved_file))
+    
+    def _recording_saved(self, saved_file):
+        """Point the file selection at the saved recording"""
+        if saved_file:
+            self.recording_file = saved_file
+            self.record_status_label.config(text="Recording saved")
+            
+            # Update the file path to the saved recording
+            self.audio_file_path.set(saved_file)
+            
+            messagebox.showinfo("Recording Complete", 
+                              f"Recording saved successfully!\n\nFile: {os.path.basename(saved_file)}\n\nYou can now transcribe this recording.")
+        else:
+            messagebox.showerror("Error", "Failed to save recording.")
+            self.record_status_label.config(text="Recording failed")
+    
     def view_recordings(self):
         """Open the recordings folder"""
-        recordings_dir = Path("recordings")
-        if recordings_dir.exists():
-            try:
-                import subprocess
-                import platform
-                
-                if platform.system() == "Windows":
-                    subprocess.run(["explorer", str(recordings_dir.absolute())])
-                elif platform.system() == "Darwin":  # macOS
-                    subprocess.run(["open", str(recordings_dir.absolute())])
-                else:  # Linux
-                    subprocess.run(["xdg-open", str(recordings_dir.absolute())])
-                    
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to open recordings folder: {str(e)}")
-        else:
-            messagebox.showinfo("No Recordings", "No recordings folder found. Record some audio first!")
+        self._open_folder(self._recordings_dir_abs, "recordings")
     
     def view_transcriptions(self):
         """Open the Transcriptions folder"""
-        transcriptions_dir = Path("Transcriptions")
-        if transcriptions_dir.exists():
-            try:
-                import subprocess
-                import platform
+        self._open_folder(self._transcriptions_dir_abs, "transcriptions")
+    
+    def _open_folder(self, path, name):
+        """Open an absolute folder path (creating it if needed) in the platform's file manager without waiting for it"""
+        try:
+            path.mkdir(exist_ok=True)
+            if sys.platform == "win32":
+                os.startfile(str(path))
+            elif sys.platform == "darwin":
+                subprocess.Popen(["open", str(path)])
+            else:
+                subprocess.Popen(["xdg-open", str(path)])
                 
-                if platform.system() == "Windows":
-                    subprocess.run(["explorer", str(transcriptions_dir.absolute())])
-                elif platform.system() == "Darwin":  # macOS
-                    subprocess.run(["open", str(transcriptions_dir.absolute())])
-                else:  # Linux
-                    subprocess.run(["xdg-open", str(transcriptions_dir.absolute())])
-                    
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to open transcriptions folder: {str(e)}")
-        else:
-            messagebox.showinfo("No Transcriptions", "No transcriptions folder found. Create some transcriptions first!")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to open {name} folder: {str(e)}")
     
     def get_selected_values(self):
-        """Get the actual values from the combo boxes"""
-        model_index = self.model_combo.current()
-        model_value = self.models[model_index][1] if model_index >= 0 else "base"
-        
-        lang_index = self.language_combo.current()
-        lang_value = self.languages[lang_index][1] if lang_index >= 0 else ""
-        
-        task_index = self.task_combo.current()
-        task_value = self.tasks[task_index][1] if task_index >= 0 else "transcribe"
-        
-        output_index = self.output_combo.current()
-        output_value = self.output_formats[output_index][1] if output_index >= 0 else "txt"
-        
-        return model_value, lang_value, task_value, output_value
+        """Get the actual values for the selected combo box entries"""
+        return (MODEL_BY_NAME.get(self.selected_model.get(), "base"),
+                LANG_BY_NAME.get(self.selected_language.get(), ""),
+                TASK_BY_NAME.get(self.selected_task.get(), "transcribe"),
+                OUTPUT_BY_NAME.get(self.selected_output.get(), "txt"))
     
     def start_transcription(self):
         """Start the transcription process in a separate thread"""
@@ -949,12 +1008,13 @@ class AudioTranscriberGUI:
             messagebox.showerror("Error", "Please select an audio file first!")
             return
         
-        if not os.path.exists(self.audio_file_path.get()):
+        if not os.path.exists(self.audio_file_path.get()) and not self._is_recorded_file(self.audio_file_path.get()):
             messagebox.showerror("Error", "Selected file does not exist!")
             return
         
         # Disable controls during transcription
         self.is_transcribing = True
+        self._streamed = False
         self.transcribe_button.config(text="Transcribing...", state="disabled")
         self.update_progress(0)
         
@@ -969,40 +1029,107 @@ class AudioTranscriberGUI:
             audio_file = self.audio_file_path.get()
             model_value, lang_value, task_value, output_value = self.get_selected_values()
             detect_speakers = self.detect_speakers.get()
+            compile_model = self.use_torch_compile.get()
+            self._device_ready.wait()
+            
+            # A muted mic or an instant Stop gives near-silence that Whisper would hallucinate on
+            if self._is_recorded_file(audio_file) and self._is_silent(self.recorded_audio):
+                self._set_ui_state(status="Recording was silent - skipping transcription")
+                return
             
-            self.update_status("Loading Whisper model...")
-            self.update_progress(10)
+            self._set_ui_state(progress=10, status="Loading Whisper model...")
             
             if detect_speakers:
                 # Use speaker diarization
-                self.update_status("Loading speaker diarization model...")
-                hf_token = self.hf_token.get().strip() if self.hf_token.get().strip() else None
-                diarizer = SpeakerDiarizer(model_value, hf_token=hf_token)
-                result = diarizer.perform_diarization(audio_file)
+                self._set_ui_state(status="Loading speaker diarization model...")
+                hf_token = self.hf_token or None
+                diarizer_key = (model_value, hf_token, compile_model)
+                if self._diarizer is None or self._diarizer_key != diarizer_key:
+                    from speaker_diarization import SpeakerDiarizer
+                    if self._diarizer is not None:
+                        self._diarizer.close()  # release the previous models before loading new ones
+                        self._diarizer = None
+                    diarizer = SpeakerDiarizer(model_value, hf_token=hf_token, device=self.device)
+                    # Compiling replaces the encoders in place, so use private model copies
+                    # rather than the ones speaker_diarization shares between diarizers
+                    diarizer.load_models(shared=not compile_model)
+                    if compile_model:
+                        diarizer.whisper_model.encoder = compile_module(diarizer.whisper_model.encoder, diarizer.device)
+                        if diarizer.diarization_pipeline:
+                            embedding = diarizer.diarization_pipeline._embedding
+                            if hasattr(embedding, "model_"):
+                                embedding.model_ = compile_module(embedding.model_, diarizer.device)
+                    
+                    # Keep the loaded models for the next run with the same settings
+                    self._diarizer = diarizer
+                    self._diarizer_key = diarizer_key
+                diarizer = self._diarizer
+                
+                # Decode once; Whisper and pyannote both read the in-memory waveform
+                self._set_ui_state(status="Loading audio...")
+                audio = self._load_audio(audio_file)
+                
+                if diarizer.diarization_pipeline:
+                    # pyannote and Whisper share no state, so run them side by side
+                    self._set_ui_state(progress=30, status="Transcribing and detecting speakers...")
+                    audio_key = self._audio_key(audio)
+                    with ThreadPoolExecutor(max_workers=2) as pool:
+                        diar_future = pool.submit(
+                            self._cached, self._diar_cache, ("diarization", audio_key),
+                            lambda: self._run_on_own_stream(diarizer.diarize, audio_file, audio=audio))
+                        asr_future = pool.submit(
+                            self._cached, self._asr_cache,
+                            ("whisper", audio_key, model_value, lang_value, task_value),
+                            lambda: self._run_on_own_stream(diarizer.transcribe, audio_file,
+                                                            language=lang_value if lang_value else None,
+                                                            task=task_value, audio=audio))
+                        diarization = diar_future.result()
+                        result = asr_future.result()
+                    diarizer.assign_speakers(result, diarizer.align_speakers(result['segments'], diarization))
+                else:
+                    # The MFCC fallback needs Whisper's segments first
+                    result = diarizer.perform_diarization(audio_file, audio=audio)
             else:
                 # Standard transcription
-                import whisper
-                model = whisper.load_model(model_value)
+                audio = self._load_audio(audio_file)
+                duration = max(len(audio) / 16000, 1e-6)
                 
-                self.update_status("Transcribing audio...")
-                self.update_progress(30)
+                self._set_ui_state(progress=30, status="Transcribing audio...")
+                self.root.after(0, self.results_text.delete, 1.0, tk.END)
                 
-                # Perform transcription
-                result = model.transcribe(
-                    audio_file,
-                    language=lang_value if lang_value else None,
-                    task=task_value,
-                    verbose=False
-                )
+                def on_segment(segment):
+                    self.root.after_idle(self._append_segment, segment)
+                    self._set_ui_state(progress=30 + 50 * min(segment["end"] / duration, 1.0))
+                
+                def run():
+                    backend = self._get_backend(model_value, compile_model)
+                    self._streamed = True
+                    return backend.transcribe(
+                        audio,
+                        language=lang_value if lang_value else None,
+                        task=task_value,
+                        on_segment=on_segment
+                    )
+                
+                # Perform transcription, showing segments as they are decoded;
+                # a re-run on the same audio and settings reuses the earlier result
+                result = self._cached(self._asr_cache,
+                                      ("backend", self._audio_key(audio), model_value, lang_value, task_value),
+                                      run)
+            
+            # Scan the segments for speaker labels once for both saving and display
+            result['_has_speakers'] = any('speaker' in s for s in result.get('segments', ()))
+            if result['_has_speakers']:
+                speakers = list(dict.fromkeys(s.get('speaker', 'Speaker 1') for s in result['segments']))
+                speakers.sort()
+                result['_speakers'] = speakers
             
-            self.update_progress(80)
-            self.update_status("Saving results...")
+            self._set_ui_state(progress=80, status="Saving results...")
             
             # Save results
             output_file = self.save_transcription(result, audio_file, output_value)
             
-            self.update_progress(100)
-            self.update_status("Transcription completed!")
+            self._set_ui_state(progress=100, status="Transcription completed!")
             
             # Display results in GUI
             self.root.after(0, self.display_results, result, output_file)
@@ -1014,98 +1141,187 @@ class AudioTranscriberGUI:
             # Re-enable controls
             self.root.after(0, self.transcription_finished)
     
+    def _set_ui_state(self, **state):
+        """Record the latest progress/status from the worker; _pump_ui shows it on the Tk thread"""
+        with self._ui_lock:
+            self._ui_state.update(state)
+    
+    def _pump_ui(self):
+        """Apply the most recent worker progress/status (10 times a second)"""
+        with self._ui_lock:
+            state = dict(self._ui_state)
+        if state != self._ui_applied:
+            if state["progress"] != self._ui_applied["progress"]:
+                self.update_progress(state["progress"])
+            if state["status"] != self._ui_applied["status"]:
+                self.update_status(state["status"])
+            self._ui_applied = state
+        self.root.after(100, self._pump_ui)
+    
+    def _get_backend(self, model_value, compile_model=False):
+        """Return the Whisper backend for a model size, keeping the two most recently used loaded"""
+        key = (model_value, "float16" if self.device == "cuda" else "int8", compile_model)
+        with self._model_lock:
+            backend = self._model_cache.pop(key, None)
+            if backend is None:
+                backend = TranscriberBackend(model_value, self.device, compile_model)
+            self._model_cache[key] = backend
+            
+            # Evict the least recently used model to free its memory
+            while len(self._model_cache) > 2:
+                del self._model_cache[next(iter(self._model_cache))]
+                if self.device == "cuda":
+                    import torch
+                    torch.cuda.empty_cache()
+        return backend
+    
+    def _is_recorded_file(self, audio_file):
+        """True when audio_file is the last microphone recording, whose samples are still in memory"""
+        return self.recorded_audio is not None and audio_file == self.recording_file
+    
+    def _audio_key(self, audio):
+        """Content hash of a decoded waveform"""
+        return hashlib.blake2b(audio.tobytes(), digest_size=16).hexdigest()
+    
+    def _cached(self, cache, key, compute):
+        """Return compute() memoized in memory for the last CACHE_SIZE keys"""
+        value = cache.pop(key, None)
+        if value is None:
+            value = compute()
+        
+        cache[key] = value
+        while len(cache) > CACHE_SIZE:
+            del cache[next(iter(cache))]
+        return value
+    
+    def _is_silent(self, audio, threshold=0.01):
+        """True when the waveform's RMS level is below threshold"""
+        return audio.size == 0 or float(np.sqrt(np.mean(np.square(audio)))) < threshold
+    
+    def _load_audio(self, audio_file):
+        """Return the 16 kHz mono waveform, reusing the in-memory recording when possible"""
+        if self._is_recorded_file(audio_file):
+            return self.recorded_audio
+        if not WHISPER_AVAILABLE:
+            from faster_whisper import decode_audio
+            return decode_audio(audio_file, sampling_rate=16000)
+        import whisper
+        return whisper.load_audio(audio_file)
+    
+    def _run_on_own_stream(self, fn, *args, **kwargs):
+        """Call fn on a dedicated CUDA stream (when on GPU) so concurrent models can overlap"""
+        if self.device != "cuda":
+            return fn(*args, **kwargs)
+        
+        import torch
+        stream = torch.cuda.Stream(device=self.device)
+        with torch.cuda.stream(stream):
+            out = fn(*args, **kwargs)
+        stream.synchronize()
+        return out
+    
+    def _detect_device(self):
+        """Pick CUDA, then MPS, then CPU"""
+        try:
+            import torch
+        except ImportError:
+            return "cpu"
+        if torch.cuda.is_available():
+            return "cuda"
+        if torch.backends.mps.is_available():
+            return "mps"
+        return "cpu"
+    
+    def _warm_model(self):
+        """Detect the compute device, then preload the default Whisper model"""
+        try:
+            self.device = self._detect_device()
+        except Exception as e:
+            print(f"Could not detect compute device: {e}")
+        finally:
+            self._device_ready.set()
+        self._ui_queue.put_nowait(("device", self.device))
+        
+        try:
+            self._get_backend("base")
+        except Exception as e:
+            print(f"Could not preload Whisper model: {e}")
+    
+    def _append_segment(self, segment):
+        """Append one decoded segment to the results box"""
+        start_time = self.format_time(segment["start"])
+        end_time = self.format_time(segment["end"])
+        self.results_text.insert(tk.END, f"[{start_time} - {end_time}] {segment['text'].strip()}\n")
+        self.results_text.see(tk.END)
+    
     def save_transcription(self, result, audio_file_path, output_format):
         """Save transcription result to file"""
         if not result:
             return None
         
-        # Create Transcriptions folder if it doesn't exist
-        transcriptions_dir = Path("Transcriptions")
-        transcriptions_dir.mkdir(exist_ok=True)
-        
+        transcriptions_dir = self._transcriptions_dir
         base_name = Path(audio_file_path).stem
         
         if output_format == "txt":
             output_file = transcriptions_dir / f"{base_name}_transcription.txt"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                # Check if speaker information is available
-                has_speakers = any('speaker' in segment for segment in result.get('segments', []))
-                
-                if has_speakers:
-                    # Format with speaker labels and timestamps
-                    for segment in result["segments"]:
-                        speaker = segment.get('speaker', 'Speaker 1')
-                        start_time = self.format_time(segment["start"])
-                        end_time = self.format_time(segment["end"])
-                        text = segment['text'].strip()
-                        f.write(f"[{start_time} - {end_time}] {speaker}: {text}\n")
-                else:
-                    # Standard format without speakers but with timestamps
-                    for segment in result["segments"]:
-                        start_time = self.format_time(segment["start"])
-                        end_time = self.format_time(segment["end"])
-                        text = segment['text'].strip()
-                        f.write(f"[{start_time} - {end_time}] {text}\n")
+            if result.get('_has_speakers'):
+                # Format with speaker labels and timestamps
+                lines = [f"[{self.format_time(s['start'])} - {self.format_time(s['end'])}] "
+                         f"{s.get('speaker', 'Speaker 1')}: {s['text'].strip()}\n"
+                         for s in result["segments"]]
+            else:
+                # Standard format without speakers but with timestamps
+                lines = [f"[{self.format_time(s['start'])} - {self.format_time(s['end'])}] {s['text'].strip()}\n"
+                         for s in result["segments"]]
+            content = "".join(lines)
         
         elif output_format == "srt":
             output_file = transcriptions_dir / f"{base_name}_transcription.srt"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                has_speakers = any('speaker' in segment for segment in result.get('segments', []))
-                
-                for i, segment in enumerate(result["segments"], 1):
-                    start_time = self.format_time_srt(segment["start"])
-                    end_time = self.format_time_srt(segment["end"])
-                    text = segment['text'].strip()
-                    
-                    if has_speakers:
-                        speaker = segment.get('speaker', 'Speaker 1')
-                        text = f"{speaker}: {text}"
-                    
-                    f.write(f"{i}\n")
-                    f.write(f"{start_time} --> {end_time}\n")
-                    f.write(f"{text}\n\n")
+            has_speakers = result.get('_has_speakers')
+            
+            buf = io.StringIO()
+            for i, s in enumerate(result["segments"], 1):
+                text = s['text'].strip()
+                if has_speakers:
+                    text = f"{s.get('speaker', 'Speaker 1')}: {text}"
+                buf.write(f"{i}\n{self.format_time_srt(s['start'])} --> {self.format_time_srt(s['end'])}\n{text}\n\n")
+            content = buf.getvalue()
         
         elif output_format == "vtt":
             output_file = transcriptions_dir / f"{base_name}_transcription.vtt"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write("WEBVTT\n\n")
-                for segment in result["segments"]:
-                    start_time = self.format_time_vtt(segment["start"])
-                    end_time = self.format_time_vtt(segment["end"])
-                    f.write(f"{start_time} --> {end_time}\n")
-                    f.write(f"{segment['text'].strip()}\n\n")
+            buf = io.StringIO()
+            buf.write("WEBVTT\n\n")
+            for s in result["segments"]:
+                buf.write(f"{self.format_time_vtt(s['start'])} --> {self.format_time_vtt(s['end'])}\n{s['text'].strip()}\n\n")
+            content = buf.getvalue()
+        
+        # One write per file instead of one per segment
+        output_file.write_text(content, encoding='utf-8')
         
         return output_file
     
-    def format_time(self, seconds):
+    @staticmethod
+    def format_time(seconds):
         """Format time in seconds to HH:MM:SS format"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+        return _hms(int(seconds))
     
-    def format_time_srt(self, seconds):
+    @staticmethod
+    def format_time_srt(seconds):
         """Format time in seconds to SRT format (HH:MM:SS,mmm)"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millisecs = int((seconds % 1) * 1000)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millisecs:03d}"
+        secs, millis = divmod(int(seconds * 1000), 1000)
+        return f"{_hms(secs)},{millis:03d}"
     
-    def format_time_vtt(self, seconds):
+    @staticmethod
+    def format_time_vtt(seconds):
         """Format time in seconds to VTT format (HH:MM:SS.mmm)"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millisecs = int((seconds % 1) * 1000)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millisecs:03d}"
+        secs, millis = divmod(int(seconds * 1000), 1000)
+        return f"{_hms(secs)}.{millis:03d}"
     
     def display_results(self, result, output_file):
         """Display transcription results in the GUI"""
-        self.results_text.delete(1.0, tk.END)
-        
-        # Check if speaker information is available
-        has_speakers = any('speaker' in segment for segment in result.get('segments', []))
+        has_speakers = result.get('_has_speakers')
+        self._pending_lines = []
+        self.load_more_button.pack_forget()
         
         # Display basic info
         info_text = f"Detected Language: {result.get('language', 'Unknown')}\n"
@@ -1114,66 +1330,96 @@ class AudioTranscriberGUI:
             info_text += f"Total Duration: {result['segments'][-1]['end']:.2f} seconds\n"
         
         if has_speakers:
-            # Count unique speakers
-            speakers = set(segment.get('speaker', 'Speaker 1') for segment in result['segments'])
-            info_text += f"Detected Speakers: {len(speakers)} ({', '.join(sorted(speakers))})\n"
+            speakers = result.get('_speakers')
+            if speakers is None:
+                speakers = list(dict.fromkeys(s.get('speaker', 'Speaker 1') for s in result['segments']))
+            info_text += f"Detected Speakers: {len(speakers)} ({', '.join(speakers)})\n"
         
         info_text += f"Output File: {output_file}\n"
         info_text += "=" * 50 + "\n\n"
         
+        # Streamed segments are already in the box; only the summary goes on top
+        if self._streamed:
+            self.results_text.insert(1.0, info_text)
+            messagebox.showinfo("Success", f"Transcription completed!\n\nOutput saved to: {output_file}")
+            return
+        
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(tk.END, info_text)
+        
         # Display transcription text
         if has_speakers:
-            # Display with speaker labels
-            transcription_text = ""
-            for segment in result["segments"]:
-                speaker = segment.get('speaker', 'Speaker 1')
-                start_time = self.format_time(segment["start"])
-                end_time = self.format_time(segment["end"])
-                text = segment['text'].strip()
-                transcription_text += f"[{start_time} - {end_time}] {speaker}: {text}\n"
+            # Display with speaker labels; very long transcripts show the first part until asked
+            lines = [f"[{self.format_time(s['start'])} - {self.format_time(s['end'])}] "
+                     f"{s.get('speaker', 'Speaker 1')}: {s['text'].strip()}\n"
+                     for s in result["segments"]]
+            if len(lines) > 10000:
+                self._pending_lines = lines[2000:]
+                lines = lines[:2000]
+                self.load_more_button.pack(anchor=tk.W, pady=(5, 0))
+            self._insert_lines(lines)
         else:
             # Standard display
-            transcription_text = result["text"]
-        
-        self.results_text.insert(tk.END, info_text + transcription_text)
+            self.results_text.insert(tk.END, result["text"])
         
         messagebox.showinfo("Success", f"Transcription completed!\n\nOutput saved to: {output_file}")
     
+    def _insert_lines(self, lines):
+        """Insert transcript lines into the results box 500 at a time, letting Tk redraw in between"""
+        for i in range(0, len(lines), 500):
+            self.results_text.insert(tk.END, "".join(lines[i:i + 500]))
+            self.results_text.update_idletasks()
+    
+    def load_more_results(self):
+        """Show the next 2000 lines of a long transcript"""
+        lines, self._pending_lines = self._pending_lines[:2000], self._pending_lines[2000:]
+        self._insert_lines(lines)
+        if not self._pending_lines:
+            self.load_more_button.pack_forget()
+    
     def show_error(self, error_msg):
         """Show error message"""
         messagebox.showerror("Error", error_msg)
-        self.update_status("Error occurred")
+        self._set_ui_state(status="Error occurred")
     
     def transcription_finished(self):
         """Re-enable controls after transcription"""
         self.is_transcribing = False
         self.transcribe_button.config(text="Start Transcription", state="normal")
-        self.update_progress(0)
+        self._set_ui_state(progress=0)
     
     def update_status(self, message):
-        """Update status label"""
+        """Update status label (skipped when the text is unchanged)"""
+        if message == self._last_status:
+            return
+        self._last_status = message
         self.status_label.config(text=message)
     
     def update_progress(self, value):
-        """Update progress bar"""
+        """Update progress bar (Tk thread only), skipping sub-pixel changes and updates within 50 ms"""
+        new_px = int(value * 4)  # the bar is 400 px wide
+        now = time.monotonic()
+        if value not in (0, 100) and (new_px == self._last_progress_px or
+                                      now - self._last_progress_ts < 0.05):
+            return
+        self._last_progress_px = new_px
+        self._last_progress_ts = now
         self.progress_var.set(value)
-        if hasattr(self, 'progress_canvas') and hasattr(self, 'progress_fill'):
-            width = int((value / 100.0) * 400)
-            self.progress_canvas.coords(self.progress_fill, 0, 0, width, 25)
-        self.root.update_idletasks()
     
     def clear_all(self):
         """Clear all fields and results"""
         self.audio_file_path.set("")
         self.results_text.delete(1.0, tk.END)
+        self._pending_lines = []
+        self.load_more_button.pack_forget()
         self.update_progress(0)
         self.update_status("Ready to transcribe")
         
         # Reset combo boxes to defaults
-        self.model_combo.set("Base (Balanced, ~1GB VRAM)")
-        self.language_combo.set("Auto-detect")
-        self.task_combo.set("Transcribe")
-        self.output_combo.set("Plain Text (.txt)")
+        self.selected_model.set(MODEL_DISPLAY[1])
+        self.selected_language.set(LANG_DISPLAY[0])
+        self.selected_task.set(TASK_DISPLAY[0])
+        self.selected_output.set(OUTPUT_DISPLAY[0])
         
         # Note: Don't clear HF token as it's persistent across sessions
     
@@ -1181,27 +1427,59 @@ class AudioTranscriberGUI:
         """Clean up resources when closing the application"""
         if hasattr(self, 'audio_recorder') and self.audio_recorder is not None:
             self.audio_recorder.cleanup()
+        
+        # Release cached models and the GPU memory they hold
+        with self._model_lock:
+            self._model_cache.clear()
+        if self._diarizer is not None:
+            self._diarizer.close()
+            self._diarizer = None
+        if self.device == "cuda":
+            import torch
+            torch.cuda.empty_cache()
 
-def main():
-    # Check if whisper is available
+def _path_hash():
+    """Hash of PATH, so a cached ffmpeg probe is redone when PATH changes"""
+    return hashlib.blake2b(os.environ.get("PATH", "").encode(), digest_size=8).hexdigest()
+
+def _check_ffmpeg_cached():
+    """True if an earlier launch with the same PATH found ffmpeg"""
     try:
-        import whisper
-    except ImportError:
-        messagebox.showerror("Error", 
-                           "Whisper is not installed!\n\n"
-                           "Please install it using:\n"
-                           "pip install openai-whisper")
-        return
-    
-    # Check if FFmpeg is available
-    import subprocess
+        with open(ENV_CACHE_FILE, 'r') as f:
+            env = json.load(f)
+        return env.get("ffmpeg_ok") is True and env.get("path_hash") == _path_hash()
+    except (OSError, ValueError):
+        return False
+
+def _probe_ffmpeg():
+    """Run ffmpeg -version, remember the result and warn if it is missing"""
     try:
         subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True)
+        ffmpeg_ok = True
     except (subprocess.CalledProcessError, FileNotFoundError):
+        ffmpeg_ok = False
+    
+    try:
+        ENV_CACHE_FILE.parent.mkdir(exist_ok=True)
+        with open(ENV_CACHE_FILE, 'w') as f:
+            json.dump({"ffmpeg_ok": ffmpeg_ok, "path_hash": _path_hash()}, f)
+    except OSError as e:
+        print(f"Could not write {ENV_CACHE_FILE}: {e}")
+    
+    if not ffmpeg_ok:
         messagebox.showwarning("Warning", 
                              "FFmpeg is not found in PATH!\n\n"
                              "Audio processing may not work properly.\n"
                              "Please install FFmpeg and try again.")
+
+def main():
+    # Check if a Whisper backend is available
+    if not FASTER_WHISPER_AVAILABLE and not WHISPER_AVAILABLE:
+        messagebox.showerror("Error", 
+                           "Whisper is not installed!\n\n"
+                           "Please install it using:\n"
+                           "pip install faster-whisper")
+        return
     
     # Check if PyAudio is available for recording
     if not AUDIO_RECORDING_AVAILABLE:
@@ -1214,6 +1492,10 @@ def main():
     root = tk.Tk()
     app = AudioTranscriberGUI(root)
     
+    # Check if FFmpeg is available once the window is up (skipped when a previous launch found it)
+    if not _check_ffmpeg_cached():
+        root.after(100, _probe_ffmpeg)
+    
     # Handle window close event
     def on_closing():
         app.cleanup()
@@ -2,14 +2,44 @@
 """
 Virtual Environment Setup Script for AudioTranscriber
 Automatically creates and manages virtual environment with dependencies
+
+Set AUDIOTRANSCRIBER_PYTHON to a shared Python installation to build the
+virtual environment on that interpreter instead of the one running this script.
+
+Set AUDIOTRANSCRIBER_VENV_CACHE=1 to archive the installed environment under
+~/.cache/audiotranscriber so that a later setup with the same requirements can
+restore it instead of re-running pip. The archive is several GB (torch,
+pyannote) and takes minutes to write, so this is off by default.
 """
 
 import os
 import sys
+import shutil
+import hashlib
+import tarfile
 import subprocess
 import platform
 from pathlib import Path
 
+# Keep pip from prompting, checking for its own updates, building from source when a wheel
+# exists, or byte-compiling every installed package up front
+PIP_FLAGS = ["--no-input", "--disable-pip-version-check", "--prefer-binary", "--no-compile"]
+
+# Archives of fully installed environments, reused instead of re-running pip
+VENV_CACHE_DIR = Path.home() / ".cache" / "audiotranscriber"
+
+def _use_posix_spawn():
+    """Check whether os.posix_spawnp is available and backed by vfork (macOS or glibc >= 2.24)"""
+    if not hasattr(os, "posix_spawnp") or not hasattr(os, "waitstatus_to_exitcode"):
+        return False
+    if sys.platform == "darwin":
+        return True
+    try:
+        libc, version = os.confstr("CS_GNU_LIBC_VERSION").split(maxsplit=1)
+        return libc == "glibc" and tuple(map(int, version.split(".")[:2])) >= (2, 24)
+    except (AttributeError, OSError, ValueError):
+        return False
+
 class VenvManager:
     """Manage virtual environment for AudioTranscriber"""
     
@@ -20,6 +50,10 @@ class VenvManager:
         self.pip_exe = None
         self.is_windows = platform.system() == "Windows"
         
+    def get_base_python(self):
+        """Get the interpreter the virtual environment is built on (AUDIOTRANSCRIBER_PYTHON or this one)"""
+        return os.environ.get("AUDIOTRANSCRIBER_PYTHON") or sys.executable
+    
     def get_venv_python(self):
         """Get the Python executable path in the virtual environment"""
         if self.is_windows:
@@ -43,8 +77,10 @@ class VenvManager:
         """Create virtual environment"""
         print("Creating virtual environment...")
         try:
+            # The venv symlinks to its base interpreter, so pointing AUDIOTRANSCRIBER_PYTHON at a
+            # shared installation lets every venv reuse the same (already cached) interpreter files
             subprocess.run([
-                sys.executable, "-m", "venv", str(self.venv_path)
+                self.get_base_python(), "-m", "venv", str(self.venv_path)
             ], check=True, capture_output=True)
             print("✓ Virtual environment created successfully")
             return True
@@ -52,9 +88,16 @@ class VenvManager:
             print(f"✗ Failed to create virtual environment: {e}")
             return False
     
+    def _pip_install(self, *args):
+        """Run a single non-interactive pip install in the virtual environment"""
+        # .pyc files are written lazily on first import instead of in a pass over every package
+        env = dict(os.environ, PIP_DISABLE_PIP_VERSION_CHECK="1", PYTHONDONTWRITEBYTECODE="1")
+        return subprocess.run([
+            str(self.get_venv_python()), "-m", "pip", "install", *PIP_FLAGS, *args
+        ], capture_output=True, text=True, env=env)
+    
     def install_dependencies(self):
         """Install dependencies in virtual environment"""
-        pip_exe = self.get_venv_pip()
         requirements_file = self.project_root / "requirements.txt"
         
         if not requirements_file.exists():
@@ -63,19 +106,8 @@ class VenvManager:
         
         print("Installing dependencies...")
         try:
-            # Try to upgrade pip first (optional)
-            try:
-                subprocess.run([
-                    str(pip_exe), "install", "--upgrade", "pip"
-                ], check=True, capture_output=True)
-                print("✓ Pip upgraded successfully")
-            except subprocess.CalledProcessError:
-                print("⚠ Pip upgrade failed, continuing with existing version")
-            
-            # Install requirements
-            result = subprocess.run([
-                str(pip_exe), "install", "-r", str(requirements_file)
-            ], capture_output=True, text=True)
+            # Upgrade pip and install requirements with a single resolver run
+            result = self._pip_install("--upgrade", "pip", "-r", str(requirements_file))
             
             if result.returncode == 0:
                 print("✓ Dependencies installed successfully")
@@ -91,17 +123,24 @@ class VenvManager:
     
     def install_optional_dependencies(self):
         """Install optional dependencies like PyAudio"""
-        pip_exe = self.get_venv_pip()
-        
         print("Installing optional dependencies...")
         optional_packages = ["pyaudio"]
         
+        # Try them all in one pip call; only fall back to one call per package if that fails
+        try:
+            print(f"Installing {', '.join(optional_packages)}...")
+            result = self._pip_install(*optional_packages)
+            if result.returncode == 0:
+                for package in optional_packages:
+                    print(f"✓ {package} installed successfully")
+                return
+        except Exception as e:
+            print(f"⚠ Batched optional install failed: {e}")
+        
         for package in optional_packages:
             try:
                 print(f"Installing {package}...")
-                result = subprocess.run([
-                    str(pip_exe), "install", package
-                ], capture_output=True, text=True)
+                result = self._pip_install(package)
                 
                 if result.returncode == 0:
                     print(f"✓ {package} installed successfully")
@@ -113,6 +152,65 @@ class VenvManager:
                 print(f"⚠ {package} installation failed (optional): {e}")
                 print(f"  You can still use AudioTranscriber without {package}")
     
+    def _requirements_hash(self):
+        """Hash everything a cached venv depends on: requirements, interpreter, platform and location"""
+        h = hashlib.blake2b(digest_size=16)
+        requirements_file = self.project_root / "requirements.txt"
+        if requirements_file.exists():
+            h.update(requirements_file.read_bytes())
+        # Scripts in the venv hardcode its absolute path and the base interpreter, so both are part of the key
+        for part in (sys.version, platform.machine(), self.get_base_python(), str(self.venv_path)):
+            h.update(part.encode("utf-8"))
+        return h.hexdigest()
+    
+    def _cache_path(self):
+        """Get the archive path for the current requirements"""
+        return VENV_CACHE_DIR / f"venv-{self._requirements_hash()}.tar.gz"
+    
+    def restore_cached_venv(self):
+        """Extract a previously cached virtual environment, if one matches"""
+        cache_path = self._cache_path()
+        if not cache_path.exists():
+            return False
+        
+        print(f"Restoring virtual environment from cache: {cache_path}")
+        try:
+            with tarfile.open(cache_path, "r:gz") as tar:
+                if hasattr(tarfile, "tar_filter"):
+                    tar.extractall(self.venv_path.parent, filter="tar")
+                else:
+                    tar.extractall(self.venv_path.parent)
+            if self.venv_exists():
+                print("✓ Virtual environment restored from cache")
+                return True
+        except Exception as e:
+            print(f"⚠ Failed to restore cached environment: {e}")
+        
+        shutil.rmtree(self.venv_path, ignore_errors=True)
+        return False
+    
+    def save_venv_cache(self):
+        """Archive the freshly installed virtual environment for later runs (AUDIOTRANSCRIBER_VENV_CACHE=1)"""
+        if os.environ.get("AUDIOTRANSCRIBER_VENV_CACHE") != "1":
+            return
+        
+        cache_path = self._cache_path()
+        tmp_path = cache_path.with_suffix(".tmp")
+        try:
+            VENV_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with tarfile.open(tmp_path, "w:gz", compresslevel=1) as tar:
+                tar.add(self.venv_path, arcname=self.venv_path.name)
+            os.replace(tmp_path, cache_path)
+            print(f"✓ Cached virtual environment at {cache_path}")
+            
+            # Keep only the newest archive; older ones were built from other requirements
+            for stale in VENV_CACHE_DIR.glob("venv-*.tar.*"):
+                if stale != cache_path:
+                    stale.unlink(missing_ok=True)
+        except Exception as e:
+            print(f"⚠ Could not cache virtual environment: {e}")
+            tmp_path.unlink(missing_ok=True)
+    
     def setup_environment(self):
         """Set up the complete environment"""
         print("=" * 60)
@@ -127,6 +225,13 @@ class VenvManager:
             print(f"Using Python: {self.python_exe}")
             return True
         
+        # Reuse a cached environment built from the same requirements
+        if self.restore_cached_venv():
+            self.python_exe = self.get_venv_python()
+            self.pip_exe = self.get_venv_pip()
+            print(f"Using Python: {self.python_exe}")
+            return True
+        
         # Create virtual environment
         if not self.create_venv():
             return False
@@ -142,6 +247,8 @@ class VenvManager:
         # Install optional dependencies (including PyAudio)
         self.install_optional_dependencies()
         
+        self.save_venv_cache()
+        
         print("=" * 60)
         print("✓ Environment setup completed successfully!")
         print("=" * 60)
@@ -156,6 +263,20 @@ class VenvManager:
         cmd = [str(self.python_exe), str(script_path)] + list(args)
         print(f"Running: {' '.join(cmd)}")
         
+        if not self.is_windows and _use_posix_spawn():
+            # Spawn directly so the child doesn't have to fork this interpreter first
+            try:
+                pid = os.posix_spawnp(cmd[0], cmd, os.environ)
+                _, status = os.waitpid(pid, 0)
+            except OSError as e:
+                print(f"✗ Script execution failed: {e}")
+                return False
+            returncode = os.waitstatus_to_exitcode(status)
+            if returncode != 0:
+                print(f"✗ Script execution failed: {cmd[1]} exited with status {returncode}")
+                return False
+            return True
+        
         try:
             subprocess.run(cmd, check=True)
             return True
@@ -4,36 +4,268 @@ Speaker Diarization Module for AudioTranscriber
 Combines Whisper transcription with speaker detection
 """
 
-import whisper
-import torch
 import numpy as np
-from pyannote.audio import Pipeline
-from pyannote.core import Segment
-import librosa
-from sklearn.cluster import AgglomerativeClustering
-from sklearn.metrics.pairwise import cosine_similarity
+import importlib.util
 import warnings
 import os
 import json
+import functools
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from huggingface_hub import login, HfApi
 warnings.filterwarnings("ignore")
 
+# Heavy libraries (whisper, torch, pyannote, librosa, scipy, huggingface_hub) are imported
+# where they are used so that importing this module stays fast; still fail at import time
+# when they are missing, so callers can keep treating ImportError as "diarization unavailable"
+for _module in ("whisper", "torch", "pyannote.audio", "librosa", "scipy", "soundfile", "huggingface_hub"):
+    if importlib.util.find_spec(_module) is None:
+        raise ImportError(f"speaker_diarization requires {_module}")
+
+# lru_cache doesn't stop two threads from loading the same model at once; callers hold this
+_model_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=4)
+def _load_whisper(model_size, device):
+    """Load a Whisper model once per (model_size, device) and share it between diarizers"""
+    import whisper
+    return whisper.load_model(model_size, device=device)
+
+@functools.lru_cache(maxsize=2)
+def _load_pipeline(token, device):
+    """Load the pyannote pipeline once per (token, device) and share it between diarizers"""
+    import torch
+    from pyannote.audio import Pipeline
+    pipeline = Pipeline.from_pretrained(
+        "pyannote/speaker-diarization-3.1",
+        use_auth_token=token
+    )
+    if device:
+        pipeline.to(torch.device(device))
+    # Files are complete up front, so feed segmentation/embedding in large batches
+    pipeline.segmentation_batch_size = 32
+    pipeline.embedding_batch_size = 32
+    return pipeline
+
+def load_audio_16k(audio_path):
+    """
+    Load an audio file as 16 kHz mono float32 for feature extraction
+    
+    Args:
+        audio_path (str): Path to audio file
+        
+    Returns:
+        np.ndarray: Mono waveform at 16 kHz
+    """
+    import librosa
+    import soundfile as sf
+    from scipy.signal import resample_poly
+    
+    try:
+        audio, sr_native = sf.read(audio_path, dtype='float32', always_2d=False)
+    except Exception:
+        # Formats libsndfile can't read (e.g. MP4 containers) still go through librosa,
+        # with its fast low-quality resampler rather than the default high-quality one
+        audio, _ = librosa.load(audio_path, sr=16000, res_type='soxr_lq')
+        return audio
+    if audio.ndim > 1:
+        audio = audio.mean(axis=1)
+    if sr_native != 16000:
+        # Polyphase resampling is plenty for MFCC speaker features
+        g = math.gcd(16000, sr_native)
+        audio = resample_poly(audio, 16000 // g, sr_native // g).astype(np.float32)
+    return audio
+
+def load_segments_16k(audio_path, starts, ends):
+    """
+    Read only the given time ranges of an audio file, as 16 kHz mono float32
+    
+    The ranges are concatenated into one buffer so callers can still run a single
+    feature pass over it.
+    
+    Args:
+        audio_path (str): Path to audio file
+        starts (np.ndarray): Range start times in seconds
+        ends (np.ndarray): Range end times in seconds
+        
+    Returns:
+        tuple: (waveform, starts, ends) with the range times remapped into the waveform
+    """
+    import soundfile as sf
+    from scipy.signal import resample_poly
+    
+    try:
+        f = sf.SoundFile(audio_path)
+    except Exception:
+        # Not seekable through libsndfile; decode the whole file instead
+        return load_audio_16k(audio_path), starts, ends
+    
+    with f:
+        file_sr = f.samplerate
+        g = math.gcd(16000, file_sr)
+        chunks = []
+        new_starts = np.empty(len(starts))
+        new_ends = np.empty(len(ends))
+        pos = 0
+        for i, (start, end) in enumerate(zip(starts, ends)):
+            first = min(int(start * file_sr), f.frames)
+            f.seek(first)
+            chunk = f.read(max(0, int(end * file_sr) - first), dtype='float32', always_2d=True).mean(axis=1)
+            if file_sr != 16000:
+                chunk = resample_poly(chunk, 16000 // g, file_sr // g).astype(np.float32)
+            new_starts[i] = pos / 16000
+            pos += len(chunk)
+            new_ends[i] = pos / 16000
+            chunks.append(chunk)
+    return np.concatenate(chunks), new_starts, new_ends
+
+# Fallback clustering: minimum cosine distance between speakers, how much the cut merge must
+# exceed the one below it to count as a speaker boundary, and an upper bound on their number
+SPEAKER_DISTANCE_THRESHOLD = 0.35
+SPEAKER_GAP_RATIO = 1.5
+MAX_SPEAKERS = 5
+# MFCC window, and the shortest segment that gets its own embedding
+MFCC_N_FFT = 2048
+MIN_EMBEDDING_SECONDS = 0.25
+# Above this many segments the fallback uses k-means (FAISS if installed, else SciPy)
+# instead of an O(N^2) distance matrix
+KMEANS_MIN_SEGMENTS = 200
+KMEANS_RESTARTS = 3
+
+def _cluster_by_dendrogram(embeddings):
+    """
+    Cluster segment embeddings hierarchically, choosing the number of speakers
+    
+    The dendrogram is built once and cut where the merge distances jump the most.
+    Single-speaker files stay in one cluster: the cut needs both the distance floor
+    and a jump that is large relative to the merge below it, since one voice's
+    segments merge at smoothly rising distances with no clear break.
+    
+    Args:
+        embeddings (np.ndarray): (segments x features) embeddings
+        
+    Returns:
+        np.ndarray: Cluster label for each segment
+    """
+    from scipy.cluster.hierarchy import linkage, fcluster
+    from scipy.spatial.distance import pdist
+    
+    # Normalize once; for unit vectors 1 - cos = |a - b|^2 / 2, so the condensed pairwise
+    # vector (N(N-1)/2 entries, no square matrix) gives the cosine distances directly
+    normalized = np.asarray(embeddings, dtype=np.float32)
+    normalized = normalized / (np.linalg.norm(normalized, axis=1, keepdims=True) + 1e-9)
+    distances = pdist(normalized, metric='sqeuclidean')
+    distances *= 0.5
+    np.clip(distances, 0.0, 2.0, out=distances)
+    linkage_matrix = linkage(distances, method='average')
+    heights = linkage_matrix[:, 2]
+    threshold = SPEAKER_DISTANCE_THRESHOLD
+    if len(heights) > 1:
+        gap = int(np.argmax(np.diff(heights)))
+        below, above = heights[gap], heights[gap + 1]
+        if above < SPEAKER_GAP_RATIO * below:
+            # No clear break anywhere in the tree: one speaker
+            return np.ones(len(heights) + 1, dtype=np.int32)
+        threshold = max(threshold, (below + above) / 2)
+    labels = fcluster(linkage_matrix, t=threshold, criterion='distance')
+    if labels.max() > MAX_SPEAKERS:
+        labels = fcluster(linkage_matrix, t=MAX_SPEAKERS, criterion='maxclust')
+    return labels
+
+def _cluster_with_kmeans(embeddings):
+    """
+    Cluster many segment embeddings with k-means in O(N) memory
+    
+    The number of speakers is picked by the dendrogram cut on a fixed-size sample.
+    FAISS is used when installed, SciPy's kmeans2 otherwise.
+    
+    Args:
+        embeddings (np.ndarray): (segments x features) embeddings
+        
+    Returns:
+        np.ndarray: Cluster label for each segment
+    """
+    sample = np.random.default_rng(0).choice(len(embeddings), KMEANS_MIN_SEGMENTS, replace=False)
+    n_speakers = int(_cluster_by_dendrogram(embeddings[sample]).max())
+    if n_speakers == 1:
+        return np.zeros(len(embeddings), dtype=np.int64)
+    
+    # k-means on unit vectors approximates the cosine clustering used for short files
+    vectors = np.ascontiguousarray(embeddings, dtype=np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-9
+    
+    try:
+        import faiss
+    except ImportError:
+        from scipy.cluster.vq import kmeans2
+        # Keep the best of a few k-means++ restarts, as FAISS does with nredo
+        best_labels, best_inertia = None, np.inf
+        for seed in range(KMEANS_RESTARTS):
+            centroids, labels = kmeans2(vectors, n_speakers, minit='++', seed=seed)
+            inertia = float(((vectors - centroids[labels]) ** 2).sum())
+            if inertia < best_inertia:
+                best_labels, best_inertia = labels, inertia
+        return best_labels
+    
+    kmeans = faiss.Kmeans(vectors.shape[1], n_speakers, niter=20, nredo=KMEANS_RESTARTS, seed=0)
+    kmeans.train(vectors)
+    _, labels = kmeans.index.search(vectors, 1)
+    return labels.ravel()
+
+def _decompose(seconds):
+    """Split seconds into (hours, minutes, seconds, milliseconds)"""
+    s, ms = divmod(int(seconds * 1000), 1000)
+    m, s = divmod(s, 60)
+    h, m = divmod(m, 60)
+    return h, m, s, ms
+
+def _segment_times(segments):
+    """Yield (start, end) _decompose() tuples, reusing the previous end when a segment starts where it ended"""
+    prev_end = prev_tuple = None
+    for segment in segments:
+        start, end = segment['start'], segment['end']
+        start_tuple = prev_tuple if start == prev_end else _decompose(start)
+        prev_end, prev_tuple = end, _decompose(end)
+        yield start_tuple, prev_tuple
+
+# Line templates for format_transcription_with_speakers, filled from _decompose() tuples
+_TXT_LINE = "[%02d:%02d:%02d - %02d:%02d:%02d] %s: %s\n"
+_SRT_BLOCK = "%d\n%02d:%02d:%02d,%03d --> %02d:%02d:%02d,%03d\n%s: %s\n\n"
+_VTT_BLOCK = "%02d:%02d:%02d.%03d --> %02d:%02d:%02d.%03d\n%s: %s\n\n"
+
+# How long a successful whoami check is trusted
+WHOAMI_TTL = 300
+
+@functools.lru_cache(maxsize=1)
+def _hf_api():
+    """Shared Hugging Face Hub client"""
+    from huggingface_hub import HfApi
+    return HfApi()
+
 class HuggingFaceAuth:
     """Handle Hugging Face authentication and token management"""
     
+    # token -> (username, time of the successful whoami call)
+    _whoami_cache = {}
+    
     def __init__(self):
-        self.config_file = Path.home() / ".audiotranscriber" / "hf_config.json"
+        self.config_file = Path.home() / ".audiotranscriber" / "hf_token"
+        # Older versions stored {"hf_token": ...} as JSON; still read it if present
+        self.legacy_config_file = self.config_file.with_name("hf_config.json")
         self.config_file.parent.mkdir(exist_ok=True)
         self.token = None
         self.is_authenticated = False
     
     def save_token(self, token):
-        """Save Hugging Face token to secure config file"""
+        """Save Hugging Face token to a config file readable only by the owner"""
         try:
-            config = {"hf_token": token}
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f)
+            fd = os.open(self.config_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                os.write(fd, token.encode("utf-8"))
+            finally:
+                os.close(fd)
             self.token = token
             self.is_authenticated = True
             return True
@@ -45,12 +277,12 @@ class HuggingFaceAuth:
         """Load Hugging Face token from config file"""
         try:
             if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    self.token = config.get("hf_token")
-                    if self.token:
-                        self.is_authenticated = True
-                        return True
+                self.token = self.config_file.read_bytes().decode("utf-8").strip() or None
+            elif self.legacy_config_file.exists():
+                self.token = json.loads(self.legacy_config_file.read_bytes()).get("hf_token")
+            if self.token:
+                self.is_authenticated = True
+                return True
         except Exception as e:
             print(f"Error loading token: {e}")
         return False
@@ -64,11 +296,17 @@ class HuggingFaceAuth:
             if not self.load_token():
                 return False
         
+        # Skip the network round-trip if this token was verified recently
+        hit = self._whoami_cache.get(self.token)
+        if hit and time.time() - hit[1] < WHOAMI_TTL:
+            self.is_authenticated = True
+            return True
+        
         try:
             # Test authentication by trying to access HF API
-            api = HfApi()
-            user_info = api.whoami(token=self.token)
+            user_info = _hf_api().whoami(token=self.token)
             print(f"Successfully authenticated as: {user_info['name']}")
+            self._whoami_cache[self.token] = (user_info['name'], time.time())
             self.is_authenticated = True
             return True
         except Exception as e:
@@ -86,6 +324,7 @@ class HuggingFaceAuth:
                 return False
         
         try:
+            from huggingface_hub import login
             login(token=self.token)
             self.is_authenticated = True
             return True
@@ -97,8 +336,9 @@ class HuggingFaceAuth:
     def clear_token(self):
         """Clear stored token"""
         try:
-            if self.config_file.exists():
-                self.config_file.unlink()
+            for path in (self.config_file, self.legacy_config_file):
+                if path.exists():
+                    path.unlink()
             self.token = None
             self.is_authenticated = False
             return True
@@ -107,43 +347,68 @@ class HuggingFaceAuth:
             return False
 
 class SpeakerDiarizer:
-    def __init__(self, model_size="base", hf_token=None):
+    def __init__(self, model_size="base", hf_token=None, device=None, persist_token=True):
         """
         Initialize the speaker diarization system
         
         Args:
             model_size (str): Whisper model size
             hf_token (str): Hugging Face token for authentication
+            device (str): Torch device for both models (e.g. "cpu", "cuda:0"); None lets Whisper choose
+            persist_token (bool): Save hf_token to the shared token file (as the CLI's
+                --hf-token does); False keeps it in memory for this diarizer only
         """
         self.model_size = model_size
+        self.device = device
         self.whisper_model = None
         self.diarization_pipeline = None
         self.hf_auth = HuggingFaceAuth()
         
         # Handle Hugging Face authentication
-        if hf_token:
+        if hf_token and persist_token:
             self.hf_auth.save_token(hf_token)
             self.hf_auth.login_to_hf(hf_token)
+        elif hf_token:
+            # Session-only token: passed straight to Pipeline.from_pretrained, never written to disk
+            self.hf_auth.token = hf_token
+            self.hf_auth.is_authenticated = True
         else:
             # Try to load existing token
             self.hf_auth.load_token()
             if self.hf_auth.is_authenticated:
                 self.hf_auth.login_to_hf()
         
-    def load_models(self):
-        """Load Whisper and speaker diarization models"""
+    def load_models(self, shared=True):
+        """
+        Load Whisper and speaker diarization models
+        
+        Args:
+            shared (bool): Reuse the process-wide cached models; False loads private
+                copies that the caller may modify (e.g. torch.compile) without
+                affecting other diarizers
+        """
+        import torch
+        
+        load_whisper = _load_whisper if shared else _load_whisper.__wrapped__
+        load_pipeline = _load_pipeline if shared else _load_pipeline.__wrapped__
+        
+        # Without an explicit device, put both models on the GPU when there is one
+        if self.device is None and torch.cuda.is_available():
+            self.device = "cuda"
+        
         print("Loading Whisper model...")
-        self.whisper_model = whisper.load_model(self.model_size)
+        # openai-whisper keeps a sparse alignment-heads buffer that MPS cannot hold
+        whisper_device = "cpu" if self.device in (None, "mps") else self.device
+        with _model_lock:
+            self.whisper_model = load_whisper(self.model_size, whisper_device)
         
         print("Loading speaker diarization pipeline...")
         try:
             # Check if we have Hugging Face authentication
             if self.hf_auth.is_authenticated:
                 print("Using Hugging Face authentication for pyannote pipeline...")
-                self.diarization_pipeline = Pipeline.from_pretrained(
-                    "pyannote/speaker-diarization-3.1",
-                    use_auth_token=self.hf_auth.token
-                )
+                with _model_lock:
+                    self.diarization_pipeline = load_pipeline(self.hf_auth.token, self.device)
                 print("Successfully loaded pyannote speaker diarization pipeline!")
             else:
                 print("Note: pyannote pipeline requires Hugging Face authentication.")
@@ -154,6 +419,18 @@ class SpeakerDiarizer:
             print("Falling back to simple speaker detection...")
             self.diarization_pipeline = None
     
+    def close(self):
+        """Release the models, including the process-wide cached copies, and free GPU memory"""
+        self.whisper_model = None
+        self.diarization_pipeline = None
+        with _model_lock:
+            _load_whisper.cache_clear()
+            _load_pipeline.cache_clear()
+        
+        import torch
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+    
     def set_hf_token(self, token):
         """Set Hugging Face token and reinitialize authentication"""
         if self.hf_auth.save_token(token):
@@ -175,76 +452,98 @@ class SpeakerDiarizer:
             "can_use_pyannote": self.diarization_pipeline is not None
         }
     
-    def extract_speaker_embeddings(self, audio_path, segments):
+    def extract_speaker_embeddings(self, audio_path, segments, audio=None):
         """
         Extract speaker embeddings for each segment using a simple approach
         
         Args:
             audio_path (str): Path to audio file
             segments (list): List of segments with timestamps
+            audio (np.ndarray): Optional preloaded 16 kHz mono waveform
             
         Returns:
             list: Speaker labels for each segment
         """
         try:
-            # Load audio
-            audio, sr = librosa.load(audio_path, sr=16000)
+            import librosa
+            from scipy.sparse import csr_matrix
+            
+            sr = 16000
+            hop = 160  # 10 ms frames, so segment boundaries map onto frames closely
+            
+            # Very short segments give unreliable MFCC means (zero padding, boundary effects);
+            # leave them out of MFCC and clustering and let them inherit a neighbour's speaker
+            starts = np.fromiter((segment['start'] for segment in segments), dtype=np.float64, count=len(segments))
+            ends = np.fromiter((segment['end'] for segment in segments), dtype=np.float64, count=len(segments))
+            is_long = (ends - starts) >= max(MIN_EMBEDDING_SECONDS, MFCC_N_FFT / sr)
+            long_idx = np.flatnonzero(is_long)
+            if len(long_idx) < 2:
+                return ["Speaker 1"] * len(segments)
             
-            # Extract features for each segment
-            embeddings = []
-            for segment in segments:
-                start_time = segment['start']
-                end_time = segment['end']
-                
-                # Convert to sample indices
-                start_sample = int(start_time * sr)
-                end_sample = int(end_time * sr)
-                
-                # Extract audio segment
-                segment_audio = audio[start_sample:end_sample]
-                
-                # Extract MFCC features as simple speaker embedding
-                mfcc = librosa.feature.mfcc(y=segment_audio, sr=sr, n_mfcc=13)
-                mfcc_mean = np.mean(mfcc, axis=1)
-                embeddings.append(mfcc_mean)
+            # Load audio; from a file, read just the long segments rather than decoding everything
+            long_starts, long_ends = starts[long_idx], ends[long_idx]
+            if audio is None:
+                audio, long_starts, long_ends = load_segments_16k(audio_path, long_starts, long_ends)
             
-            # Cluster embeddings to identify speakers
-            if len(embeddings) > 1:
-                embeddings_array = np.array(embeddings)
-                
-                # Use cosine similarity for clustering
-                similarity_matrix = cosine_similarity(embeddings_array)
-                distance_matrix = 1 - similarity_matrix
-                
-                # Perform clustering
-                n_speakers = min(5, len(segments))  # Assume max 5 speakers
-                clustering = AgglomerativeClustering(
-                    n_clusters=n_speakers,
-                    metric='precomputed',
-                    linkage='average'
-                )
-                
-                speaker_labels = clustering.fit_predict(distance_matrix)
-                
-                # Rename speakers to Speaker 1, Speaker 2, etc.
-                unique_labels = np.unique(speaker_labels)
-                speaker_mapping = {label: f"Speaker {i+1}" for i, label in enumerate(unique_labels)}
-                speaker_names = [speaker_mapping[label] for label in speaker_labels]
-                
-                return speaker_names
+            # One MFCC pass over the whole file; each segment averages its span of frames
+            # float32 end to end: librosa follows the input dtype, and the averaging matmul and
+            # distance GEMM downstream then run in single precision
+            audio = np.asarray(audio, dtype=np.float32)
+            mel = librosa.feature.melspectrogram(y=audio, sr=sr, n_fft=MFCC_N_FFT, hop_length=hop, n_mels=40)
+            mfcc_full = librosa.feature.mfcc(S=librosa.power_to_db(mel), n_mfcc=13).astype(np.float32, copy=False)
+            n_frames = mfcc_full.shape[1]
+            
+            # Frame span of each long segment (at least one frame, clipped to the file)
+            f0 = np.minimum((long_starts * sr).astype(np.int64) // hop, n_frames - 1)
+            f1 = np.minimum(np.maximum(f0 + 1, (long_ends * sr).astype(np.int64) // hop), n_frames)
+            spans = f1 - f0
+            
+            # Sparse (segments x frames) averaging matrix: segment means become one matmul
+            rows = np.repeat(np.arange(len(long_idx)), spans)
+            offsets = np.cumsum(spans) - spans
+            cols = np.arange(spans.sum()) - np.repeat(offsets - f0, spans)
+            weights = np.repeat((1.0 / spans).astype(np.float32), spans)
+            averaging = csr_matrix((weights, (rows, cols)), shape=(len(long_idx), n_frames))
+            
+            # One contiguous float32 (segments x 12) block, written directly by the matmul.
+            # c0 is overall loudness rather than voice and would dominate the cosine distance,
+            # so it is left out (centering instead turns one speaker's noise into directions)
+            embeddings_array = np.ascontiguousarray(averaging @ mfcc_full[1:].T, dtype=np.float32)
+            
+            # Cluster embeddings to identify speakers.
+            # Hierarchical clustering is O(N^2) in memory, so long files use k-means
+            if len(embeddings_array) > KMEANS_MIN_SEGMENTS:
+                long_labels = _cluster_with_kmeans(embeddings_array)
             else:
-                return ["Speaker 1"]
-                
+                long_labels = _cluster_by_dendrogram(embeddings_array)
+            
+            # Short segments take the label of the long segment nearest to them in time
+            centers = (starts + ends) / 2
+            long_centers = centers[long_idx]
+            right = np.clip(np.searchsorted(long_centers, centers), 1, len(long_idx) - 1)
+            left = right - 1
+            nearest = np.where(centers - long_centers[left] <= long_centers[right] - centers, left, right)
+            speaker_labels = long_labels[nearest]
+            
+            # Rename speakers to Speaker 1, Speaker 2, etc.
+            unique_labels, label_index = np.unique(speaker_labels, return_inverse=True)
+            names = [f"Speaker {i+1}" for i in range(len(unique_labels))]
+            return [names[i] for i in label_index.tolist()]
+            
         except Exception as e:
             print(f"Error in speaker embedding extraction: {e}")
             return ["Speaker 1"] * len(segments)
     
-    def perform_diarization(self, audio_path):
+    def perform_diarization(self, audio_path, language=None, task="transcribe", audio=None):
         """
         Perform speaker diarization on audio file
         
         Args:
             audio_path (str): Path to audio file
+            language (str): Language code, or None to auto-detect
+            task (str): "transcribe" or "translate"
+            audio (np.ndarray): Optional preloaded 16 kHz mono float32 waveform;
+                when given, neither model decodes the file again
             
         Returns:
             dict: Transcription result with speaker information
@@ -252,46 +551,145 @@ class SpeakerDiarizer:
         if not self.whisper_model:
             self.load_models()
         
-        print("Transcribing audio with Whisper...")
-        # Transcribe with Whisper
-        result = self.whisper_model.transcribe(audio_path, verbose=False)
-        
-        print("Detecting speakers...")
-        # Extract speaker information
         if self.diarization_pipeline:
-            # Use pyannote for advanced diarization
-            diarization = self.diarization_pipeline(audio_path)
+            # Decode once (16 kHz mono float32) and hand the same waveform to both models
+            if audio is None:
+                import whisper
+                audio = whisper.load_audio(audio_path)
+            
+            # Whisper and pyannote only meet at the alignment step, so run them side by side
+            # (both spend their time in native code that releases the GIL)
+            print("Transcribing audio with Whisper and detecting speakers...")
+            # On CUDA each model gets its own stream so their kernels can overlap too
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                diarization_future = executor.submit(self._run_on_own_stream, self.diarize,
+                                                     audio_path, audio=audio)
+                result = self._run_on_own_stream(self.transcribe, audio_path, language=language,
+                                                 task=task, audio=audio)
+                diarization = diarization_future.result()
             
             # Align Whisper segments with speaker segments
-            speaker_segments = []
-            for segment in result['segments']:
-                segment_start = segment['start']
-                segment_end = segment['end']
-                
-                # Find overlapping speaker segments
-                speakers_in_segment = []
-                for turn, _, speaker in diarization.itertracks(yield_label=True):
-                    if turn.start <= segment_end and turn.end >= segment_start:
-                        speakers_in_segment.append(speaker)
-                
-                # Assign speaker (use most common speaker in segment)
-                if speakers_in_segment:
-                    speaker = max(set(speakers_in_segment), key=speakers_in_segment.count)
-                    speaker_segments.append(speaker)
-                else:
-                    speaker_segments.append("Speaker 1")
+            speaker_segments = self.align_speakers(result['segments'], diarization)
         else:
-            # Use simple speaker detection
-            speaker_segments = self.extract_speaker_embeddings(audio_path, result['segments'])
+            print("Transcribing audio with Whisper...")
+            result = self.transcribe(audio_path, language=language, task=task, audio=audio)
+            
+            # Use simple speaker detection; without a preloaded waveform it reads
+            # only the segments it needs from the file (load_segments_16k)
+            print("Detecting speakers...")
+            speaker_segments = self.extract_speaker_embeddings(audio_path, result['segments'], audio=audio)
+        
+        self.assign_speakers(result, speaker_segments)
+        return result
+    
+    def _run_on_own_stream(self, fn, *args, **kwargs):
+        """Call fn on a dedicated CUDA stream (when on GPU) so concurrent models can overlap"""
+        if not (self.device and self.device.startswith("cuda")):
+            return fn(*args, **kwargs)
+        
+        import torch
+        # On the selected GPU (e.g. "cuda:1"), not whichever device is current
+        stream = torch.cuda.Stream(device=self.device)
+        with torch.cuda.stream(stream):
+            out = fn(*args, **kwargs)
+        stream.synchronize()
+        return out
+    
+    def transcribe(self, audio_path, language=None, task="transcribe", audio=None):
+        """
+        Transcribe audio with the loaded Whisper model
+        
+        Args:
+            audio_path (str): Path to audio file
+            language (str): Language code, or None to auto-detect
+            task (str): "transcribe" or "translate"
+            audio (np.ndarray): Optional preloaded 16 kHz mono float32 waveform
+            
+        Returns:
+            dict: Whisper transcription result
+        """
+        return self.whisper_model.transcribe(audio_path if audio is None else audio,
+                                             language=language, task=task, verbose=False,
+                                             fp16=self.whisper_model.device.type == "cuda")
+    
+    def diarize(self, audio_path, audio=None):
+        """
+        Run the pyannote pipeline on the audio
+        
+        Args:
+            audio_path (str): Path to audio file
+            audio (np.ndarray): Optional preloaded 16 kHz mono float32 waveform
+            
+        Returns:
+            Annotation: Speaker turns, or None when the pipeline is unavailable
+        """
+        if not self.diarization_pipeline:
+            return None
+        import torch
         
-        # Add speaker information to result
+        if audio is None:
+            source = audio_path
+        else:
+            # Reuse the caller's decoded waveform (no copy when it is already contiguous float32)
+            waveform = torch.from_numpy(np.ascontiguousarray(audio, dtype=np.float32))
+            source = {"waveform": waveform[None], "sample_rate": 16000}
+        if self.device and self.device.startswith("cuda"):
+            # Half-precision segmentation/embedding inference on CUDA
+            with torch.autocast("cuda", dtype=torch.float16):
+                return self.diarization_pipeline(source)
+        return self.diarization_pipeline(source)
+    
+    def assign_speakers(self, result, speaker_segments):
+        """Attach speaker labels to the segments of a Whisper result"""
         for i, segment in enumerate(result['segments']):
             if i < len(speaker_segments):
                 segment['speaker'] = speaker_segments[i]
             else:
                 segment['speaker'] = "Speaker 1"
+    
+    def align_speakers(self, segments, diarization):
+        """
+        Assign each Whisper segment the speaker with the most overlapping time
+        among the diarization turns
         
-        return result
+        Args:
+            segments (list): Whisper segments with start/end times
+            diarization (Annotation): pyannote diarization output
+            
+        Returns:
+            list: Speaker label for each segment
+        """
+        turns = sorted((turn.start, turn.end, speaker)
+                       for turn, _, speaker in diarization.itertracks(yield_label=True))
+        if not segments or not turns:
+            return ["Speaker 1"] * len(segments)
+        
+        starts = np.array([t[0] for t in turns])
+        # Turns may overlap, so search a running max of end times to keep it sorted
+        max_ends = np.maximum.accumulate(np.array([t[1] for t in turns]))
+        seg_start = [segment['start'] for segment in segments]
+        seg_end = [segment['end'] for segment in segments]
+        # Back to Python ints/floats: the per-turn loop below is much slower on NumPy scalars
+        lo = np.searchsorted(max_ends, seg_start, side='left').tolist()
+        hi = np.searchsorted(starts, seg_end, side='right').tolist()
+        
+        speakers = []
+        for s0, s1, a, b in zip(seg_start, seg_end, lo, hi):
+            overlap = {}
+            touching = None
+            for i in range(a, b):
+                t0, t1, speaker = turns[i]
+                d = min(t1, s1) - max(t0, s0)
+                if d > 0:
+                    overlap[speaker] = overlap.get(speaker, 0.0) + d
+                elif d == 0 and touching is None:
+                    touching = speaker
+            if overlap:
+                speakers.append(max(overlap, key=overlap.get))
+            else:
+                # Zero-length segments (or ones that only touch a turn) take the turn at that instant
+                speakers.append(touching or "Speaker 1")
+        return speakers
     
     def format_transcription_with_speakers(self, result, output_format="txt"):
         """
@@ -304,67 +702,63 @@ class SpeakerDiarizer:
         Returns:
             str: Formatted transcription
         """
+        speaker_default = 'Speaker 1'
+        segments = result['segments']
+        times = _segment_times(segments)
+        
         if output_format == "txt":
-            formatted_text = ""
-            for segment in result['segments']:
-                speaker = segment.get('speaker', 'Speaker 1')
-                start_time = self.format_time(segment['start'])
-                end_time = self.format_time(segment['end'])
-                text = segment['text'].strip()
-                
-                formatted_text += f"[{start_time} - {end_time}] {speaker}: {text}\n"
-            
-            return formatted_text
+            parts = [_TXT_LINE % (*start[:3], *end[:3],
+                                  segment.get('speaker', speaker_default), segment['text'].strip())
+                     for segment, (start, end) in zip(segments, times)]
+            return "".join(parts)
         
         elif output_format == "srt":
-            srt_text = ""
-            for i, segment in enumerate(result['segments'], 1):
-                speaker = segment.get('speaker', 'Speaker 1')
-                start_time = self.format_time_srt(segment['start'])
-                end_time = self.format_time_srt(segment['end'])
-                text = segment['text'].strip()
-                
-                srt_text += f"{i}\n"
-                srt_text += f"{start_time} --> {end_time}\n"
-                srt_text += f"{speaker}: {text}\n\n"
-            
-            return srt_text
+            parts = [_SRT_BLOCK % (i, *start, *end,
+                                   segment.get('speaker', speaker_default), segment['text'].strip())
+                     for i, (segment, (start, end)) in enumerate(zip(segments, times), 1)]
+            return "".join(parts)
         
         elif output_format == "vtt":
-            vtt_text = "WEBVTT\n\n"
-            for segment in result['segments']:
-                speaker = segment.get('speaker', 'Speaker 1')
-                start_time = self.format_time_vtt(segment['start'])
-                end_time = self.format_time_vtt(segment['end'])
-                text = segment['text'].strip()
-                
-                vtt_text += f"{start_time} --> {end_time}\n"
-                vtt_text += f"{speaker}: {text}\n\n"
-            
-            return vtt_text
+            parts = ["WEBVTT\n\n"]
+            parts.extend(_VTT_BLOCK % (*start, *end,
+                                       segment.get('speaker', speaker_default), segment['text'].strip())
+                         for segment, (start, end) in zip(segments, times))
+            return "".join(parts)
     
     def format_time(self, seconds):
         """Format time in seconds to HH:MM:SS format"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+        return "%02d:%02d:%02d" % _decompose(seconds)[:3]
     
     def format_time_srt(self, seconds):
         """Format time in seconds to SRT format (HH:MM:SS,mmm)"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millisecs = int((seconds % 1) * 1000)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millisecs:03d}"
+        return "%02d:%02d:%02d,%03d" % _decompose(seconds)
     
     def format_time_vtt(self, seconds):
         """Format time in seconds to VTT format (HH:MM:SS.mmm)"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millisecs = int((seconds % 1) * 1000)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millisecs:03d}"
+        return "%02d:%02d:%02d.%03d" % _decompose(seconds)
+
+def transcribe_with_speaker_diarization(audio_path, model_size="base", language=None,
+                                        task="transcribe", hf_token=None, device=None,
+                                        diarizer=None, audio=None):
+    """
+    Transcribe an audio file and label each segment with its speaker
+    
+    Args:
+        audio_path (str): Path to audio file
+        model_size (str): Whisper model size
+        language (str): Language code, or None to auto-detect
+        task (str): "transcribe" or "translate"
+        hf_token (str): Hugging Face token for the pyannote pipeline
+        device (str): Torch device for both models
+        diarizer (SpeakerDiarizer): Already-loaded diarizer to reuse across calls
+        audio (np.ndarray): Optional preloaded 16 kHz mono float32 waveform
+        
+    Returns:
+        dict: Transcription result with speaker information
+    """
+    if diarizer is None:
+        diarizer = SpeakerDiarizer(model_size, hf_token, device=device)
+    return diarizer.perform_diarization(audio_path, language=language, task=task, audio=audio)
 
 def test_speaker_diarization():
     """Test function for speaker diarization"""
@@ -0,0 +1,30 @@
+"""Speaker-count checks for the MFCC fallback clustering in speaker_diarization"""
+
+import numpy as np
+import pytest
+
+# The module refuses to import without whisper, torch and pyannote installed
+sd = pytest.importorskip("speaker_diarization", exc_type=ImportError)
+
+
+def _speaker_segments(n_speakers, per_speaker, seed=0):
+    """Synthetic segment embeddings: one random MFCC mean per speaker (c1..c12) plus per-segment noise"""
+    rng = np.random.default_rng(seed)
+    means = rng.normal(0.0, 20.0, (n_speakers, 12))
+    return np.vstack([mean + rng.normal(0.0, 6.0, (per_speaker, 12)) for mean in means]).astype(np.float32)
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("n_speakers", [1, 2])
+def test_dendrogram_speaker_count(n_speakers, seed):
+    embeddings = _speaker_segments(n_speakers, 40, seed)
+    labels = sd._cluster_by_dendrogram(embeddings)
+    assert len(np.unique(labels)) == n_speakers
+
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("n_speakers", [1, 2])
+def test_kmeans_speaker_count(n_speakers, seed):
+    embeddings = _speaker_segments(n_speakers, sd.KMEANS_MIN_SEGMENTS, seed)
+    labels = sd._cluster_with_kmeans(embeddings)
+    assert len(np.unique(labels)) == n_speakers